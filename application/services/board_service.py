@@ -1,6 +1,7 @@
 from application.commands.board_ticket import BoardTicket
 from domain.common.time import Clock
 from domain.ticket.model import Ticket
+from domain.ticket.states import TicketState
 
 
 class BoardService:
@@ -16,8 +17,8 @@ class BoardService:
         """
         Executes the BoardTicket command.
         """
-        if ticket.state != "CHECKED_IN":
+        if ticket.state != TicketState.CHECKED_IN:
             raise ValueError("Only checked-in tickets can be boarded")
 
-        ticket.board(self._clock)
+        ticket.board(occurred_at=self._clock.now())
         return ticket
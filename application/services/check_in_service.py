@@ -1,6 +1,7 @@
 from application.commands.check_in_ticket import CheckInTicket
 from domain.common.time import Clock
 from domain.ticket.model import Ticket
+from domain.ticket.states import TicketState
 
 
 class CheckInService:
@@ -16,8 +17,8 @@ class CheckInService:
         """
         Executes the CheckInTicket command.
         """
-        if ticket.state != "PAID":
+        if ticket.state != TicketState.PAID:
             raise ValueError("Only paid tickets can be checked in")
 
-        ticket.check_in(self._clock)
+        ticket.check_in(occurred_at=self._clock.now())
         return ticket
@@ -1,6 +1,7 @@
 from application.commands.close_ticket import CloseTicket
 from domain.common.time import Clock
 from domain.ticket.model import Ticket
+from domain.ticket.states import TicketState
 
 
 class CloseService:
@@ -16,8 +17,8 @@ class CloseService:
         """
         Executes the CloseTicket command.
         """
-        if ticket.state != "BOARDED":
+        if ticket.state != TicketState.BOARDED:
             raise ValueError("Only boarded tickets can be closed")
 
-        ticket.close(self._clock)
+        ticket.close(occurred_at=self._clock.now())
         return ticket
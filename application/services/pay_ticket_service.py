@@ -1,6 +1,7 @@
 from application.commands.pay_ticket import PayTicket
 from domain.common.time import Clock
 from domain.ticket.model import Ticket
+from domain.ticket.states import TicketState
 
 
 class PayTicketService:
@@ -16,7 +17,7 @@ class PayTicketService:
         """
         Executes the PayTicket command.
         """
-        if ticket.state != "ISSUED":
+        if ticket.state != TicketState.ISSUED:
             raise ValueError("Only issued tickets can be paid")
 
         ticket.mark_paid(self._clock)
@@ -0,0 +1,43 @@
+from domain.common.errors import InvariantViolation
+from domain.common.identifiers import TicketNumber
+from domain.common.time import Clock
+from domain.flight.model import Flight
+from domain.flight.rules import assert_flight_bookable
+from domain.ticket.model import Ticket
+
+
+class TicketPipelineService:
+    """
+    Application Service running a ticket through its whole lifecycle
+    (issue -> pay -> check-in -> board -> close) in one call.
+    """
+
+    def __init__(self, clock: Clock):
+        self._clock = clock
+
+    def run_full_lifecycle(
+        self,
+        flight: Flight,
+        ticket_number: TicketNumber,
+        passenger_id: str,
+        price: float,
+    ) -> Ticket:
+        """
+        Issues a ticket on the flight, pays it in full and closes it.
+        All five steps are recorded at one instant: a single clock reading.
+        """
+        if not passenger_id or not passenger_id.strip():
+            raise InvariantViolation("Passenger identity must be provided")
+
+        # Cross-aggregate rule: flight must be bookable
+        assert_flight_bookable(flight)
+
+        now = self._clock.now()
+
+        ticket = Ticket(ticket_id=ticket_number.value, flight_id=flight.flight_id.value)
+        ticket.issue(price=price, occurred_at=now)
+        ticket.pay(amount=price, occurred_at=now)
+        ticket.check_in(occurred_at=now)
+        ticket.board(occurred_at=now)
+        ticket.close(occurred_at=now)
+        return ticket
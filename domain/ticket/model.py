@@ -1,18 +1,20 @@
 # domain/ticket/model.py
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from domain.common.recorded_event import RecordedEvent
+from domain.ticket.states import TicketState
 
 class Ticket:
     def __init__(self, ticket_id: str, flight_id: str):
         self.ticket_id = ticket_id
         self.flight_id = flight_id
-        self.state = "created"
+        self.state = TicketState.CREATED
+        self.no_show_flag = False
         self.events: List[RecordedEvent] = []
 
-    def record_event(self, event_type: str, **data):
+    def record_event(self, event_type: str, occurred_at: Optional[datetime] = None, **data):
         event = RecordedEvent(
-            occurred_at=datetime.utcnow(),
+            occurred_at=occurred_at if occurred_at is not None else datetime.utcnow(),
             entity_id=self.ticket_id,
             event_type=event_type,
             data=data
@@ -20,22 +22,31 @@ class Ticket:
         self.events.append(event)
 
     # Ticket lifecycle methods
-    def issue(self, price: float):
-        self.state = "issued"
-        self.record_event("issued", price=price)
+    def issue(self, price: float, *, occurred_at: Optional[datetime] = None):
+        self.state = TicketState.ISSUED
+        self.record_event("issued", occurred_at, price=price)
 
-    def pay(self, amount: float):
-        self.state = "paid"
-        self.record_event("paid", amount=amount)
+    def pay(self, amount: float, *, occurred_at: Optional[datetime] = None):
+        self.state = TicketState.PAID
+        self.record_event("paid", occurred_at, amount=amount)
 
-    def check_in(self):
-        self.state = "checked-in"
-        self.record_event("checked_in")
+    def check_in(self, *, occurred_at: Optional[datetime] = None):
+        self.state = TicketState.CHECKED_IN
+        self.record_event("checked_in", occurred_at)
 
-    def board(self):
-        self.state = "boarded"
-        self.record_event("boarded")
+    def board(self, *, occurred_at: Optional[datetime] = None):
+        self.state = TicketState.BOARDED
+        self.record_event("boarded", occurred_at)
 
-    def close(self):
-        self.state = "closed"
-        self.record_event("closed")
+    def close(self, *, occurred_at: Optional[datetime] = None):
+        self.state = TicketState.CLOSED
+        self.record_event("closed", occurred_at)
+
+    def cancel(self, *, occurred_at: Optional[datetime] = None):
+        self.state = TicketState.CANCELLED
+        self.record_event("cancelled", occurred_at)
+
+    def no_show(self, *, occurred_at: Optional[datetime] = None):
+        self.state = TicketState.NO_SHOW
+        self.no_show_flag = True
+        self.record_event("no_show", occurred_at)
@@ -1,10 +1,18 @@
 # domain/ticket/states.py
 
-from enum import Enum
+from enum import IntEnum
 
-class TicketState(Enum):
-    ISSUED = "issued"
-    PAID = "paid"
-    CHECKED_IN = "checked_in"
-    BOARDED = "boarded"
-    CLOSED = "closed"
+class TicketState(IntEnum):
+    """
+    Lifecycle states, numbered in lifecycle order so that
+    `state >= TicketState.PAID` means "reached at least PAID".
+    Negative values leave the lifecycle early.
+    """
+    CREATED = 0
+    ISSUED = 1
+    PAID = 2
+    CHECKED_IN = 3
+    BOARDED = 4
+    CLOSED = 5
+    CANCELLED = -1
+    NO_SHOW = -2
@@ -4,7 +4,7 @@ import json
 from dataclasses import asdict, is_dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import Iterable, List
 
 from domain.common.identifiers import FlightId, TicketNumber
 from domain.ticket.events import (
@@ -37,14 +37,17 @@ class EventRepository:
         self.log_dir = self.base_dir / "logs"
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-    def save(self, flight_id: str, event) -> None:
+    def _log_file(self, flight_id: str) -> Path:
+        return self.log_dir / f"flight_{flight_id}_events.log"
+
+    @staticmethod
+    def _record_line(event) -> str:
         """
-        Instance method: save one event into the flight log file.
+        Serialize one event into its JSON log line.
         """
         if not is_dataclass(event):
             raise TypeError("EventRepository.save expects a dataclass event")
 
-        log_file = self.log_dir / f"flight_{flight_id}_events.log"
         payload = asdict(event)
 
         # Ensure occurred_at is timezone-aware UTC
@@ -62,8 +65,30 @@ class EventRepository:
             "payload": payload,
         }
 
-        with log_file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+        return json.dumps(record) + "\n"
+
+    def save(self, flight_id: str, event) -> None:
+        """
+        Instance method: save one event into the flight log file.
+        """
+        line = self._record_line(event)
+
+        with self._log_file(flight_id).open("a", encoding="utf-8") as f:
+            f.write(line)
+
+    def save_events_bulk(self, flight_id: str, events: Iterable[object]) -> int:
+        """
+        Save many events into the flight log file with one open and one write.
+        Every event is serialized before the file is touched.
+        Returns the number of events written.
+        """
+        lines = [self._record_line(event) for event in events]
+
+        if lines:
+            with self._log_file(flight_id).open("a", encoding="utf-8") as f:
+                f.writelines(lines)
+
+        return len(lines)
 
     def save_event(self, flight_id: str, event) -> None:
         """
@@ -76,7 +101,7 @@ class EventRepository:
         """
         Load and re-hydrate events for a flight.
         """
-        log_file = self.log_dir / f"flight_{flight_id}_events.log"
+        log_file = self._log_file(flight_id)
         if not log_file.exists():
             return []
 
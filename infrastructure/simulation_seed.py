@@ -0,0 +1,14 @@
+# infrastructure/simulation_seed.py
+
+import os
+
+# Optional deterministic seed for the simulators, exported by run_full_pipeline
+SEED_ENV_VAR = "CHAD_AIRLINE_SEED"
+
+
+def simulation_seed() -> int | None:
+    """
+    The run's seed from CHAD_AIRLINE_SEED, or None (fresh entropy) if unset.
+    """
+    value = os.environ.get(SEED_ENV_VAR)
+    return int(value) if value else None
@@ -1,6 +1,8 @@
 # simulations/advanced_ticket_lifecycle_simulator.py
 
 import random
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 from datetime import datetime
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable
@@ -94,8 +95,11 @@ def pick_key_decisions(board_df: pd.DataFrame) -> pd.DataFrame:
 def iter_pngs(images_dir: Path) -> Iterable[Path]:
     if not images_dir.exists():
         return []
+    # One directory pass; DirEntry carries the file type, so no per-entry stat
+    with os.scandir(images_dir) as entries:
+        all_png = [Path(e.path) for e in entries if e.name.endswith(".png") and e.is_file()]
+
     # Keep a stable order: heatmaps first, then revenue distributions, then everything else.
-    all_png = sorted(images_dir.glob("*.png"), key=lambda p: p.name.lower())
 
     def rank(name: str) -> int:
         n = name.lower()
@@ -109,7 +113,7 @@ def iter_pngs(images_dir: Path) -> Iterable[Path]:
             return 3
         return 9
 
-    return sorted(all_png, key=lambda p: (rank(p.name), p.name.lower()))
+    return sorted(all_png, key=lambda p: (rank(p.name), p.name.lower(), p.name))
 
 
 def scaled_image(path: Path, max_w: float, max_h: float) -> Image:
@@ -16,7 +16,7 @@ STRICT RULES:
 
 from pathlib import Path
 from datetime import datetime, UTC
-import json
+import orjson
 import pandas as pd
 
 
@@ -45,65 +45,102 @@ THRESHOLDS = {
 
 
 # ------------------------------------------------------------------------------
-# SIGNAL DETECTION
+# LEDGER STREAMING
 # ------------------------------------------------------------------------------
 
-def detect_signals(df: pd.DataFrame) -> pd.DataFrame:
-    signals = []
+KEYS = ["flight", "class"]
+LEDGER_COLUMNS = KEYS + ["incident_type"]
 
-    grouped = df.groupby(["flight", "class"])
+# The ledger is append-only; read it in bounded chunks so memory stays flat
+LEDGER_CHUNK_ROWS = 500_000
 
-    for (flight, cls), g in grouped:
-        total = len(g)
 
-        overrides = (g["incident_type"] == "Human Override").sum()
-        high_loss = (g["incident_type"] == "Accepted High Loss Probability").sum()
-        stress = (g["incident_type"] == "Stress Exposure").sum()
+def accumulate(total: pd.Series | None, part: pd.Series) -> pd.Series:
+    if total is None:
+        return part
+    return total.add(part, fill_value=0)
 
-        if total == 0:
-            continue
 
-        override_rate = overrides / total
-        high_loss_rate = high_loss / total
-        stress_rate = stress / total
+def incident_counts(path: Path) -> tuple[pd.Series, pd.DataFrame]:
+    """
+    Stream the ledger and return:
+    - totals:  rows per (flight, class)
+    - by_type: (flight, class) x incident_type count table
+    """
+    totals = None
+    by_type = None
 
-        incident_repeats = g["incident_type"].value_counts().max()
+    for chunk in pd.read_csv(path, usecols=LEDGER_COLUMNS, chunksize=LEDGER_CHUNK_ROWS):
+        totals = accumulate(totals, chunk.groupby(KEYS).size())
+        by_type = accumulate(by_type, chunk.groupby(LEDGER_COLUMNS).size())
 
-        warnings = []
+    empty = pd.MultiIndex.from_tuples([], names=KEYS)
 
-        if override_rate >= THRESHOLDS["human_override_rate"]:
-            warnings.append("Excessive human overrides")
+    if totals is None:
+        return pd.Series(dtype="int64", index=empty), pd.DataFrame(index=empty)
 
-        if high_loss_rate >= THRESHOLDS["high_loss_acceptance_rate"]:
-            warnings.append("Repeated acceptance of high-loss decisions")
+    totals = totals.sort_index().astype("int64")
 
-        if stress_rate >= THRESHOLDS["stress_exposure_rate"]:
-            warnings.append("Recurring stress exposure")
+    if by_type is None or by_type.empty:
+        return totals, pd.DataFrame(index=totals.index)
 
-        if incident_repeats >= THRESHOLDS["incident_repeat_count"]:
-            warnings.append("Repeated incident pattern detected")
+    by_type = (
+        by_type.astype("int64")
+        .unstack("incident_type", fill_value=0)
+        .reindex(totals.index, fill_value=0)
+    )
 
-        if warnings:
-            signals.append(
-                {
-                    "flight": flight,
-                    "class": cls,
-                    "override_rate": round(override_rate, 2),
-                    "high_loss_acceptance_rate": round(high_loss_rate, 2),
-                    "stress_exposure_rate": round(stress_rate, 2),
-                    "total_incidents": total,
-                    "warnings": "; ".join(warnings),
-                }
-            )
+    return totals, by_type
 
-    return pd.DataFrame(signals)
+
+# ------------------------------------------------------------------------------
+# SIGNAL DETECTION
+# ------------------------------------------------------------------------------
+
+def detect_signals(totals: pd.Series, by_type: pd.DataFrame) -> pd.DataFrame:
+    override_rate = by_type.get("Human Override", 0) / totals
+    high_loss_rate = by_type.get("Accepted High Loss Probability", 0) / totals
+    stress_rate = by_type.get("Stress Exposure", 0) / totals
+
+    incident_repeats = by_type.max(axis=1)
+
+    checks = [
+        (override_rate >= THRESHOLDS["human_override_rate"],
+         "Excessive human overrides"),
+        (high_loss_rate >= THRESHOLDS["high_loss_acceptance_rate"],
+         "Repeated acceptance of high-loss decisions"),
+        (stress_rate >= THRESHOLDS["stress_exposure_rate"],
+         "Recurring stress exposure"),
+        (incident_repeats >= THRESHOLDS["incident_repeat_count"],
+         "Repeated incident pattern detected"),
+    ]
+
+    masks = [mask.to_numpy() for mask, _ in checks]
+    messages = [message for _, message in checks]
+    warnings = [
+        "; ".join(m for m, hit in zip(messages, hits) if hit)
+        for hits in zip(*masks)
+    ]
+
+    signals = pd.DataFrame(
+        {
+            "override_rate": override_rate.round(2),
+            "high_loss_acceptance_rate": high_loss_rate.round(2),
+            "stress_exposure_rate": stress_rate.round(2),
+            "total_incidents": totals,
+            "warnings": warnings,
+        },
+        index=totals.index,
+    ).reset_index()
+
+    return signals[signals["warnings"] != ""].reset_index(drop=True)
 
 
 # ------------------------------------------------------------------------------
 # SAFETY TRIGGER BUILDER
 # ------------------------------------------------------------------------------
 
-def build_triggers(df: pd.DataFrame) -> dict:
+def build_triggers(df: pd.DataFrame, generated_at: str) -> dict:
     triggers = []
 
     for _, row in df.iterrows():
@@ -118,7 +155,7 @@ def build_triggers(df: pd.DataFrame) -> dict:
         )
 
     return {
-        "generated_at": datetime.now(UTC).isoformat(),
+        "generated_at": generated_at,
         "total_triggers": len(triggers),
         "triggers": triggers,
     }
@@ -134,21 +171,22 @@ def main():
     if not RISK_MEMORY.exists():
         raise RuntimeError("Risk memory ledger missing — post-mortem engine required")
 
-    memory = pd.read_csv(RISK_MEMORY)
+    totals, by_type = incident_counts(RISK_MEMORY)
 
-    signals = detect_signals(memory)
+    signals = detect_signals(totals, by_type)
 
     if signals.empty:
         print("✅ No early warning signals detected")
         return
 
-    signals["generated_at"] = datetime.now(UTC).isoformat()
+    run_ts = datetime.now(UTC).isoformat()
+
+    signals["generated_at"] = run_ts
     signals.to_csv(EARLY_WARNING_REPORT, index=False)
 
-    triggers = build_triggers(signals)
+    triggers = build_triggers(signals, run_ts)
 
-    with open(SAFETY_TRIGGERS, "w") as f:
-        json.dump(triggers, f, indent=2)
+    SAFETY_TRIGGERS.write_bytes(orjson.dumps(triggers, option=orjson.OPT_INDENT_2))
 
     print("⚠ EARLY WARNING SIGNALS DETECTED")
     print(f"📄 Report: {EARLY_WARNING_REPORT}")
@@ -54,6 +54,7 @@ def main():
         raise FileNotFoundError(f"Missing board decision file: {INPUT_FILE}")
 
     df = pd.read_csv(INPUT_FILE)
+    run_ts = datetime.now(UTC).isoformat()
 
     execution_rows = []
 
@@ -68,10 +69,10 @@ def main():
             "responsible_unit": template["responsible_unit"],
             "review_horizon_days": template["review_horizon_days"],
             "risk_control": template["risk_control"],
-            "generated_at": datetime.now(UTC).isoformat()
         })
 
     execution_df = pd.DataFrame(execution_rows)
+    execution_df["generated_at"] = run_ts
 
     execution_df.to_csv(OUTPUT_FILE, index=False)
 
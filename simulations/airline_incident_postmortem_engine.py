@@ -14,6 +14,7 @@ Design principles:
 
 from datetime import datetime, UTC
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 
@@ -48,38 +49,86 @@ def safe_load(name: str) -> pd.DataFrame:
     return pd.read_csv(path)
 
 
-def safe_merge(left: pd.DataFrame, right: pd.DataFrame, on: list[str]) -> pd.DataFrame:
-    if right.empty:
-        return left
-    overlap = set(left.columns) & set(right.columns) - set(on)
-    right = right.drop(columns=list(overlap), errors="ignore")
-    return left.merge(right, on=on, how="left")
+KEYS = ["flight", "class"]
+
+
+def join_inputs(base: pd.DataFrame, others: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Left-join every non-empty input onto base by (flight, class).
+    Columns already present keep the value from the earlier frame.
+    Keys are indexed once; each frame is then joined onto base on its own,
+    so keys missing from base never widen base's dtypes.
+    """
+    seen = set(base.columns)
+    added = []
+    indexed = []
+
+    for right in others:
+        if right.empty:
+            continue
+        keep = [c for c in right.columns if c not in seen]
+        seen.update(keep)
+        added.extend(keep)
+        indexed.append(right.set_index(KEYS)[keep])
+
+    if not indexed:
+        return base.copy()
+
+    joined = base.set_index(KEYS)
+    for right in indexed:
+        joined = joined.join(right, how="left")
+
+    joined = joined.reset_index()
+    return joined[list(base.columns) + added]
 
 
 # ------------------------------------------------------------------------------
 # INCIDENT CLASSIFICATION
 # ------------------------------------------------------------------------------
 
-def classify_incident(row) -> str:
-    if row.get("human_override", False):
-        return "Human Override"
-    if row.get("decision") == "APPROVE" and row.get("probability_of_loss", 0) > 0.15:
-        return "Accepted High Loss Probability"
-    if row.get("decision") == "REJECT" and row.get("raroc", 0) > 0:
-        return "Over-Conservatism"
-    if row.get("stress_loss", 0) < 0:
-        return "Stress Exposure"
-    return "Normal Operation"
+LEARNING_SIGNALS = {
+    "Human Override": "Improve model transparency",
+    "Accepted High Loss Probability": "Recalibrate loss tolerance",
+    "Over-Conservatism": "Review rejection thresholds",
+    "Stress Exposure": "Increase stress buffers",
+    "Normal Operation": "No action required",
+}
+
 
+def column_or(df: pd.DataFrame, name: str, default) -> pd.Series:
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index)
 
-def learning_signal(row) -> str:
-    return {
-        "Human Override": "Improve model transparency",
-        "Accepted High Loss Probability": "Recalibrate loss tolerance",
-        "Over-Conservatism": "Review rejection thresholds",
-        "Stress Exposure": "Increase stress buffers",
-        "Normal Operation": "No action required",
-    }.get(row["incident_type"], "No action required")
+
+def classify_incidents(df: pd.DataFrame) -> pd.Series:
+    """
+    Column-wise incident classification.
+    Rules are evaluated in priority order; the first match wins.
+    """
+    decision = column_or(df, "decision", None)
+
+    conditions = [
+        column_or(df, "human_override", False).astype(bool),
+        (decision == "APPROVE") & (column_or(df, "probability_of_loss", 0) > 0.15),
+        (decision == "REJECT") & (column_or(df, "raroc", 0) > 0),
+        column_or(df, "stress_loss", 0) < 0,
+    ]
+    choices = [
+        "Human Override",
+        "Accepted High Loss Probability",
+        "Over-Conservatism",
+        "Stress Exposure",
+    ]
+
+    return pd.Series(
+        np.select(conditions, choices, default="Normal Operation"),
+        index=df.index,
+    )
+
+
+def learning_signals(incident_type: pd.Series) -> pd.Series:
+    return incident_type.map(LEARNING_SIGNALS).fillna("No action required")
 
 
 # ------------------------------------------------------------------------------
@@ -99,16 +148,10 @@ def main():
     loss_prob = safe_load("loss_prob")
     override = safe_load("override")
 
-    df = board.copy()
-
-    df = safe_merge(df, risk, ["flight", "class"])
-    df = safe_merge(df, raroc, ["flight", "class"])
-    df = safe_merge(df, stress, ["flight", "class"])
-    df = safe_merge(df, loss_prob, ["flight", "class"])
-    df = safe_merge(df, override, ["flight", "class"])
+    df = join_inputs(board, [risk, raroc, stress, loss_prob, override])
 
-    df["incident_type"] = df.apply(classify_incident, axis=1)
-    df["learning_signal"] = df.apply(learning_signal, axis=1)
+    df["incident_type"] = classify_incidents(df)
+    df["learning_signal"] = learning_signals(df["incident_type"])
     df["postmortem_timestamp"] = datetime.now(UTC).isoformat()
 
     df.to_csv(POSTMORTEM_REPORT, index=False)
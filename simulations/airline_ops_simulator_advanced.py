@@ -1,54 +1,62 @@
 # tests/airline_ops_simulator_advanced.py
 from datetime import timedelta
-from threading import Thread, Lock
 from domain.flight.model import Flight, FlightStatus
 from domain.flight.events import FlightStatusChanged
 from domain.ticket.model import Ticket
 from domain.ticket.events import TicketIssued, TicketPaid
 from infrastructure.event_repository import EventRepository
 from domain.common.time import Clock
+from ticket_identifiers import ticket_identifiers
 
-# Thread-safe lock for flight updates
-flight_lock = Lock()
 
-def process_flight(flight: Flight, tickets_per_flight: int, clock: Clock, events: EventRepository):
+def process_flight(flight: Flight, tickets_per_flight: int, clock: Clock, events: EventRepository) -> int:
     """
     Processes a single flight in advanced simulation.
     Includes ticket issuance, payment, and flight status changes.
+    Each call only touches its own flight, so no locking is needed.
+    Returns the number of events saved.
     """
+    saved = 0
+
     # Skip cancelled flights
     if flight.status == FlightStatus.CANCELLED:
-        return
+        return saved
 
     try:
-        # Change flight status safely
-        with flight_lock:
-            old_status = flight.status
-            flight.status = FlightStatus.SCHEDULED
-            events.save(
-                FlightStatusChanged(
-                    occurred_at=clock.now(),
-                    flight_id=flight.flight_id,
-                    old_status=old_status,
-                    new_status=flight.status
-                )
+        # Change flight status
+        old_status = flight.status
+        flight.status = FlightStatus.SCHEDULED
+        events.save(
+            FlightStatusChanged(
+                occurred_at=clock.now(),
+                flight_id=flight.flight_id,
+                old_status=old_status,
+                new_status=flight.status
             )
+        )
+        saved += 1
+
+        ticket_ids, passenger_ids = ticket_identifiers(flight.flight_id, tickets_per_flight)
 
         # Issue and pay tickets
-        for i in range(1, tickets_per_flight + 1):
-            ticket_id = f"{flight.flight_id}-T{i:04d}"
-            passenger_id = f"PASS-{flight.flight_id}-{i:04d}"
+        for ticket_id, passenger_id in zip(ticket_ids, passenger_ids):
+            # One clock read per ticket: issue and payment share the timestamp
+            now = clock.now()
 
             # Issue ticket
             ticket = Ticket(ticket_id=ticket_id, flight_id=flight.flight_id, passenger_id=passenger_id)
-            events.save(TicketIssued(occurred_at=clock.now(), ticket_id=ticket.ticket_id, flight_id=flight.flight_id, passenger_id=passenger_id))
+            events.save(TicketIssued(occurred_at=now, ticket_id=ticket.ticket_id, flight_id=flight.flight_id, passenger_id=passenger_id))
+            saved += 1
 
             # Pay ticket
-            events.save(TicketPaid(occurred_at=clock.now(), ticket_id=ticket.ticket_id))
+            events.save(TicketPaid(occurred_at=now, ticket_id=ticket.ticket_id))
+            saved += 1
 
     except Exception as e:
         print(f"Error processing flight {flight.flight_id.value}: {e}")
 
+    return saved
+
 
 def run_advanced_simulation(flights, tickets_per_flight: int = 500):
     """
@@ -56,17 +64,11 @@ def run_advanced_simulation(flights, tickets_per_flight: int = 500):
     """
     clock = Clock()
     events = EventRepository()
-    threads = []
-
-    for flight in flights:
-        t = Thread(target=process_flight, args=(flight, tickets_per_flight, clock, events))
-        t.start()
-        threads.append(t)
 
-    for t in threads:
-        t.join()
+    # The repository is file-backed; count saves here instead of re-reading every log
+    total_events = sum(process_flight(flight, tickets_per_flight, clock, events) for flight in flights)
 
-    print(f"Advanced simulation finished. Total events: {len(events.all())}")
+    print(f"Advanced simulation finished. Total events: {total_events}")
 
 
 if __name__ == "__main__":
@@ -1,25 +1,30 @@
+import numpy as np
 import pandas as pd
 
 INPUT_CSV = "logs_monte_carlo_dashboard/airline_risk_report.csv"
 OUTPUT_CSV = "logs_monte_carlo_dashboard/airline_raroc_report.csv"
 
-def compute_raroc(row):
-    expected_loss = row["CVaR_95"]
-    economic_capital = max(row["mean_revenue"] - row["VaR_95"], 1)
-    return (row["mean_revenue"] - expected_loss) / economic_capital
+def compute_raroc(df: pd.DataFrame) -> pd.Series:
+    expected_loss = df["CVaR_95"]
+    economic_capital = np.maximum(df["mean_revenue"] - df["VaR_95"], 1)
+    return (df["mean_revenue"] - expected_loss) / economic_capital
 
 def main():
     print("\n🏦 AIRLINE RAROC ENGINE\n")
 
     df = pd.read_csv(INPUT_CSV)
 
-    df["RAROC"] = df.apply(compute_raroc, axis=1)
+    df["RAROC"] = compute_raroc(df)
 
-    df["decision"] = df["RAROC"].apply(
-        lambda x: "EXPAND" if x > 2.0 else "MAINTAIN" if x > 1.2 else "EXIT"
+    df["decision"] = np.select(
+        [df["RAROC"] > 2.0, df["RAROC"] > 1.2],
+        ["EXPAND", "MAINTAIN"],
+        default="EXIT",
     )
 
-    df = df.sort_values("RAROC", ascending=False)
+    # Stable descending order from one argsort; rows are gathered in a single take
+    order = np.argsort(-df["RAROC"].to_numpy(), kind="stable")
+    df = df.iloc[order]
 
     print(df[["flight", "class", "RAROC", "decision"]])
 
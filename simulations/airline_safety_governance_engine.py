@@ -15,7 +15,7 @@ ABSOLUTE RULES:
 
 from pathlib import Path
 from datetime import datetime, UTC
-import json
+import orjson
 import pandas as pd
 
 
@@ -108,17 +108,18 @@ REDLINES = [
 def main():
     print("\n🧭 AIRLINE SAFETY GOVERNANCE & ETHICS ENGINE\n")
 
+    run_ts = datetime.now(UTC).isoformat()
+
     ethics_payload = {
-        "generated_at": datetime.now(UTC).isoformat(),
+        "generated_at": run_ts,
         "policy_type": "IMMUTABLE",
         "ethics_constraints": ETHICS_POLICY,
     }
 
-    with open(ETHICS_CONSTRAINTS, "w") as f:
-        json.dump(ethics_payload, f, indent=2)
+    ETHICS_CONSTRAINTS.write_bytes(orjson.dumps(ethics_payload, option=orjson.OPT_INDENT_2))
 
     redlines_df = pd.DataFrame(REDLINES)
-    redlines_df["generated_at"] = datetime.now(UTC).isoformat()
+    redlines_df["generated_at"] = run_ts
     redlines_df.to_csv(AUTOMATION_REDLINES, index=False)
 
     print("🔒 ETHICS CONSTRAINTS ESTABLISHED")
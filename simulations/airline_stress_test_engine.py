@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import os
+import numpy as np
 import pandas as pd
 
 BASE_DIR = "logs_monte_carlo_dashboard"
@@ -8,6 +9,10 @@ RAROC_FILE = os.path.join(BASE_DIR, "airline_raroc_report.csv")
 LOSS_FILE = os.path.join(BASE_DIR, "probability_of_loss_report.csv")
 OUT_FILE = os.path.join(BASE_DIR, "airline_stress_test_report.csv")
 
+# Only these columns feed the stress test; the rest of each report is never parsed
+RAROC_COLUMNS = {"flight", "class", "RAROC"}
+LOSS_COLUMNS = ["flight", "class", "probability_of_loss"]
+
 
 def main() -> None:
     os.makedirs(BASE_DIR, exist_ok=True)
@@ -20,15 +25,16 @@ def main() -> None:
         print(f"✅ Stress report saved to {OUT_FILE} (empty: missing raroc report)")
         return
 
-    raroc_df = pd.read_csv(RAROC_FILE)
+    # RAROC may be absent (defaulted below), so project with a callable
+    raroc_df = pd.read_csv(RAROC_FILE, usecols=lambda c: c in RAROC_COLUMNS)
 
     # loss is optional, but improves survival labeling
     if os.path.exists(LOSS_FILE) and os.stat(LOSS_FILE).st_size >= 10:
-        loss_df = pd.read_csv(LOSS_FILE)[["flight", "class", "probability_of_loss"]]
+        loss_df = pd.read_csv(LOSS_FILE, usecols=LOSS_COLUMNS)
         df = raroc_df.merge(loss_df, on=["flight", "class"], how="left")
         df["probability_of_loss"] = df["probability_of_loss"].fillna(0.0)
     else:
-        df = raroc_df.copy()
+        df = raroc_df
         df["probability_of_loss"] = 0.0
 
     if "RAROC" not in df.columns:
@@ -36,15 +42,21 @@ def main() -> None:
 
     # Deterministic stress multiplier
     stress_multiplier = 0.85  # stress reduces performance
-    df["stress_multiplier"] = stress_multiplier
-    df["stressed_raroc"] = df["RAROC"] * stress_multiplier
+    stressed_raroc = df["RAROC"] * stress_multiplier
 
     # Deterministic survival rule (works with your board logic)
     # Survive if stressed raroc >= 1.0 and probability_of_loss <= 0.07
-    df["survival"] = "SURVIVES"
-    df.loc[(df["stressed_raroc"] < 1.0) | (df["probability_of_loss"] > 0.07), "survival"] = "FAILS"
+    fails = (stressed_raroc < 1.0) | (df["probability_of_loss"] > 0.07)
 
-    out = df[["flight", "class", "stress_multiplier", "stressed_raroc", "survival"]].copy()
+    out = pd.DataFrame(
+        {
+            "flight": df["flight"],
+            "class": df["class"],
+            "stress_multiplier": stress_multiplier,
+            "stressed_raroc": stressed_raroc,
+            "survival": np.where(fails, "FAILS", "SURVIVES"),
+        }
+    )
     out.to_csv(OUT_FILE, index=False)
 
     print(f"✅ Stress report saved to {OUT_FILE}")
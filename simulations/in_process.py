@@ -0,0 +1,133 @@
+# simulations/in_process.py
+from __future__ import annotations
+
+import ast
+import importlib.util
+import os
+import runpy
+import sys
+import traceback
+from contextlib import ExitStack, contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import TextIO
+
+
+def script_sys_path(script_path: Path, env: dict[str, str] | None, cwd: Path) -> list[str]:
+    """
+    The sys.path entries `python script` would put in front of the standard
+    ones: the script's directory, then the env's PYTHONPATH entries.
+    """
+    entries = [str(script_path.parent)]
+    pythonpath = (env or {}).get("PYTHONPATH", "")
+    for entry in pythonpath.split(os.pathsep):
+        if entry:
+            entries.append(str((cwd / entry).resolve()))
+    return entries
+
+
+def imports_available(script_path: Path) -> bool:
+    """
+    True if every module the script imports at top level can be found on
+    the current sys.path. Checked before the script runs, so a script that
+    cannot run in this interpreter is never partly executed.
+    """
+    try:
+        tree = ast.parse(script_path.read_text(encoding="utf-8"), str(script_path))
+    except (OSError, SyntaxError, ValueError):
+        return True  # let the run itself report it
+
+    modules: list[str] = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module != "__future__":
+            modules.append(node.module)
+
+    for module in modules:
+        try:
+            if importlib.util.find_spec(module) is None:
+                return False
+        except (ImportError, ValueError):
+            return False
+    return True
+
+
+@contextmanager
+def patched_env(env: dict[str, str] | None):
+    """
+    Make os.environ match env (if given) for the duration of the block, then
+    restore it, including any changes the block itself made.
+    """
+    saved = dict(os.environ)
+
+    # Only the keys that differ are written: env is normally os.environ plus
+    # a few pipeline variables
+    if env is not None:
+        for key in saved.keys() - env.keys():
+            del os.environ[key]
+        for key, value in env.items():
+            if saved.get(key) != value:
+                os.environ[key] = value
+    try:
+        yield
+    finally:
+        for key in os.environ.keys() - saved.keys():
+            del os.environ[key]
+        for key, value in saved.items():
+            if os.environ.get(key) != value:
+                os.environ[key] = value
+
+
+def run_in_process(
+    script_path: Path,
+    argv: list[str],
+    *,
+    env: dict[str, str] | None,
+    cwd: Path,
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
+) -> int | None:
+    """
+    Run a script inside this interpreter exactly as `python script args...`
+    would (as __main__, with argv, cwd, sys.path and env set for it), and
+    restore all four afterwards. Output goes to stdout/stderr if given.
+
+    Returns the exit code, or None, before running anything, if the script's
+    top-level imports cannot be found here (the caller then uses a
+    subprocess). Once the script has started, an ImportError is an ordinary
+    failure (rc=1).
+    """
+    saved_argv = sys.argv[:]
+    saved_path = sys.path[:]
+    saved_cwd = os.getcwd()
+
+    try:
+        sys.argv = argv
+        sys.path[:0] = script_sys_path(script_path, env, cwd)
+        os.chdir(cwd)
+        if not imports_available(script_path):
+            return None
+
+        with ExitStack() as stack:
+            stack.enter_context(patched_env(env))
+            if stdout is not None:
+                stack.enter_context(redirect_stdout(stdout))
+            if stderr is not None:
+                stack.enter_context(redirect_stderr(stderr))
+            try:
+                runpy.run_path(str(script_path), run_name="__main__")
+            except SystemExit as e:
+                if e.code is None:
+                    return 0
+                if isinstance(e.code, int):
+                    return e.code
+                print(e.code, file=sys.stderr)
+                return 1
+            except Exception:
+                traceback.print_exc()
+                return 1
+        return 0
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        os.chdir(saved_cwd)
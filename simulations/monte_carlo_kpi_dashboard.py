@@ -1,11 +1,14 @@
 # simulations/monte_carlo_kpi_dashboard.py
 
-import random
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+from infrastructure.simulation_seed import simulation_seed
+from monte_carlo_runs import simulate_class_runs
 
 # --- Config ---
 FLIGHTS = [f"FL-{1000+i+1}" for i in range(10)]
@@ -15,23 +18,15 @@ CLASSES = {
     "first": {"capacity": 20, "price_range": (500, 1000)}
 }
 MONTE_CARLO_RUNS = 500
+rng = np.random.default_rng(simulation_seed())
 LOG_DIR = "logs_monte_carlo_dashboard"
 os.makedirs(LOG_DIR, exist_ok=True)
 
 # --- Monte Carlo simulation per flight/class ---
 def simulate_class(flight_id, cls, info):
-    revenues, load_factors, denied_boardings = [], [], []
-
-    for _ in range(MONTE_CARLO_RUNS):
-        issued = info["capacity"] + random.randint(-5, 10)
-        prices = [random.uniform(*info["price_range"]) for _ in range(issued)]
-        boarded = min(issued, info["capacity"])
-        denied = max(0, issued - info["capacity"])
-        revenue = sum(prices[:boarded])
-
-        revenues.append(revenue)
-        load_factors.append(boarded / info["capacity"] * 100)
-        denied_boardings.append(denied)
+    revenues, load_factors, denied_boardings = simulate_class_runs(
+        info["capacity"], info["price_range"], MONTE_CARLO_RUNS, rng
+    )
 
     # Save logs
     df = pd.DataFrame({
@@ -67,14 +62,39 @@ summary_df = pd.DataFrame(summary_rows)
 print("\n========== AIRLINE MONTE CARLO KPI DASHBOARD ==========\n")
 print(summary_df.to_string(index=False))
 
+# --- Revenue density (Gaussian KDE, Scott's rule as in seaborn) ---
+KDE_GRID_POINTS = 512
+KDE_CUT = 3  # grid extends this many bandwidths past the data
+
+def kde_bandwidth(values):
+    return values.std(ddof=1) * len(values) ** (-1 / 5)
+
+def revenue_density(values, grid, bandwidth):
+    # grid x runs is small (512 x MONTE_CARLO_RUNS): evaluate in one broadcast
+    z = (grid[:, None] - values[None, :]) / bandwidth
+    return np.exp(-0.5 * z ** 2).sum(axis=1) / (len(values) * bandwidth * np.sqrt(2 * np.pi))
+
 # --- Visualization ---
 sns.set(style="whitegrid")
 
-# Revenue distributions
+# Revenue distributions: all classes of a flight share one evaluation grid
 for flight_id, classes_data in all_data.items():
+    revenues = {cls: df["revenue"].to_numpy() for cls, df in classes_data.items()}
+    bandwidths = {cls: kde_bandwidth(values) for cls, values in revenues.items()}
+    pad = KDE_CUT * max(bandwidths.values())
+    grid = np.linspace(
+        min(values.min() for values in revenues.values()) - pad,
+        max(values.max() for values in revenues.values()) + pad,
+        KDE_GRID_POINTS,
+    )
+
     plt.figure(figsize=(10,6))
-    for cls, df in classes_data.items():
-        sns.kdeplot(df["revenue"], label=cls, fill=True)
+    for cls, values in revenues.items():
+        if bandwidths[cls] <= 0:
+            continue  # constant revenue has no density to draw
+        density = revenue_density(values, grid, bandwidths[cls])
+        line, = plt.plot(grid, density, label=cls)
+        plt.fill_between(grid, density, color=line.get_color(), alpha=0.25)
     plt.title(f"{flight_id} Revenue Distribution by Class")
     plt.xlabel("Revenue ($)")
     plt.ylabel("Density")
@@ -84,13 +104,14 @@ for flight_id, classes_data in all_data.items():
     plt.close()
 
 # Load Factor Heatmap
-heatmap_data = pd.DataFrame(index=[f for f in FLIGHTS], columns=[c for c in CLASSES])
-for flight_id in FLIGHTS:
-    for cls in CLASSES:
-        heatmap_data.loc[flight_id, cls] = all_data[flight_id][cls]["load"].mean()
+heatmap_data = pd.DataFrame(
+    np.array([[all_data[f][c]["load"].mean() for c in CLASSES] for f in FLIGHTS], dtype=np.float64),
+    index=FLIGHTS,
+    columns=list(CLASSES),
+)
 
 plt.figure(figsize=(8,6))
-sns.heatmap(heatmap_data.astype(float), annot=True, fmt=".1f", cmap="YlGnBu")
+sns.heatmap(heatmap_data, annot=True, fmt=".1f", cmap="YlGnBu")
 plt.title("Mean Load Factor (%) per Flight/Class")
 plt.tight_layout()
 plt.savefig("load_factor_heatmap.png")
@@ -1,10 +1,13 @@
 # simulations/monte_carlo_kpi_report.py
 
-import random
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 from datetime import datetime
 import os
+from infrastructure.simulation_seed import simulation_seed
+from monte_carlo_runs import simulate_class_runs
 
 # --- Config ---
 FLIGHTS = [f"FL-{1000+i+1}" for i in range(10)]
@@ -14,25 +17,15 @@ CLASSES = {
     "first": {"capacity": 20, "price_range": (500, 1000)}
 }
 MONTE_CARLO_RUNS = 500
+rng = np.random.default_rng(simulation_seed())
 LOG_DIR = "logs_monte_carlo"
 os.makedirs(LOG_DIR, exist_ok=True)
 
 # --- Run simulation for one flight/class ---
 def simulate_class(flight_id, cls, info):
-    revenues = []
-    load_factors = []
-    denied_boardings = []
-
-    for _ in range(MONTE_CARLO_RUNS):
-        issued_tickets = info["capacity"] + random.randint(-5, 10)
-        prices = [random.uniform(*info["price_range"]) for _ in range(issued_tickets)]
-        boarded = min(issued_tickets, info["capacity"])
-        denied = max(0, issued_tickets - info["capacity"])
-        revenue = sum(prices[:boarded])
-
-        revenues.append(revenue)
-        load_factors.append(boarded / info["capacity"] * 100)
-        denied_boardings.append(denied)
+    revenues, load_factors, denied_boardings = simulate_class_runs(
+        info["capacity"], info["price_range"], MONTE_CARLO_RUNS, rng
+    )
 
     # Log for reproducibility
     with open(f"{LOG_DIR}/{flight_id}_{cls}_simulation.log", "w") as f:
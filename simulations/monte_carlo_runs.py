@@ -0,0 +1,22 @@
+# simulations/monte_carlo_runs.py
+import numpy as np
+
+
+def simulate_class_runs(capacity: int, price_range: tuple[float, float], runs: int, rng: np.random.Generator):
+    """
+    Monte Carlo runs for one cabin class: between 5 under and 10 over
+    capacity are issued per run, and boarded seats pay a uniform fare.
+    Returns (revenues, load_factors, denied_boardings), one entry per run.
+    """
+    issued = capacity + rng.integers(-5, 11, size=runs)
+    boarded = np.minimum(issued, capacity)
+    denied = np.maximum(0, issued - capacity)
+
+    # All runs drawn at once: one row per run, one column per seat;
+    # only the first `boarded` seats of each run earn revenue
+    prices = rng.uniform(*price_range, size=(runs, capacity))
+    prices[np.arange(capacity) >= boarded[:, None]] = 0.0
+    revenues = prices.sum(axis=1)
+
+    load_factors = boarded / capacity * 100
+    return revenues, load_factors, denied
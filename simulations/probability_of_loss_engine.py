@@ -1,4 +1,5 @@
 import math
+import numpy as np
 import pandas as pd
 
 INPUT_CSV = "logs_monte_carlo_dashboard/airline_risk_report.csv"
@@ -6,52 +7,62 @@ OUTPUT_CSV = "logs_monte_carlo_dashboard/probability_of_loss_report.csv"
 
 # ---------- NORMAL DISTRIBUTION (NO SCIPY) ----------
 
-def normal_cdf(x: float, mean: float, std: float) -> float:
-    if std == 0:
-        return 0.0 if x < mean else 1.0
-    z = (x - mean) / (std * math.sqrt(2))
-    return 0.5 * (1 + math.erf(z))
+_erf = np.vectorize(math.erf, otypes=[float])
 
 
-def probability_of_loss(mean_revenue: float, revenue_std: float, cost: float) -> float:
+def normal_cdf(x: np.ndarray, mean: np.ndarray, std: np.ndarray) -> np.ndarray:
+    x, mean, std = np.broadcast_arrays(
+        np.asarray(x, dtype=float),
+        np.asarray(mean, dtype=float),
+        np.asarray(std, dtype=float),
+    )
+    degenerate = std == 0
+    z = (x - mean) / (np.where(degenerate, 1.0, std) * math.sqrt(2))
+    cdf = 0.5 * (1 + _erf(z))
+    return np.where(degenerate, np.where(x < mean, 0.0, 1.0), cdf)
+
+
+def probability_of_loss(mean_revenue: np.ndarray, revenue_std: np.ndarray, cost: np.ndarray) -> np.ndarray:
     """
     P(Revenue < Cost)
     """
     return normal_cdf(cost, mean_revenue, revenue_std)
 
 
+# ---------- RISK LEVELS ----------
+
+# p < 0.05 -> SAFE, 0.05 <= p < 0.15 -> WARNING, otherwise (incl. NaN) CRITICAL
+RISK_THRESHOLDS = [0.05, 0.15]
+RISK_LEVELS = np.array(["SAFE", "WARNING", "CRITICAL"])
+
+
+def risk_levels(p_loss: np.ndarray) -> np.ndarray:
+    return RISK_LEVELS[np.digitize(p_loss, RISK_THRESHOLDS)]
+
+
 # ---------- MAIN ENGINE ----------
 
 def main():
     df = pd.read_csv(INPUT_CSV)
 
     COST_RATIO = 0.85  # 85% of mean revenue assumed as operating cost
-    results = []
-
-    for _, row in df.iterrows():
-        cost = row["mean_revenue"] * COST_RATIO
-        p_loss = probability_of_loss(
-            mean_revenue=row["mean_revenue"],
-            revenue_std=row["revenue_std"],
-            cost=cost,
-        )
-
-        risk_level = (
-            "SAFE" if p_loss < 0.05 else
-            "WARNING" if p_loss < 0.15 else
-            "CRITICAL"
-        )
-
-        results.append({
-            "flight": row["flight"],
-            "class": row["class"],
-            "mean_revenue": row["mean_revenue"],
-            "revenue_std": row["revenue_std"],
-            "probability_of_loss": round(p_loss, 4),
-            "risk_level": risk_level,
-        })
-
-    out_df = pd.DataFrame(results)
+
+    mean = df["mean_revenue"].to_numpy(dtype=float)
+    std = df["revenue_std"].to_numpy(dtype=float)
+    cost = mean * COST_RATIO
+
+    p_loss = probability_of_loss(mean_revenue=mean, revenue_std=std, cost=cost)
+
+    risk_level = risk_levels(p_loss)
+
+    out_df = pd.DataFrame({
+        "flight": df["flight"],
+        "class": df["class"],
+        "mean_revenue": df["mean_revenue"],
+        "revenue_std": df["revenue_std"],
+        "probability_of_loss": np.round(p_loss, 4),
+        "risk_level": risk_level,
+    })
     out_df.to_csv(OUTPUT_CSV, index=False)
 
     print("\n📊 PROBABILITY OF LOSS REPORT\n")
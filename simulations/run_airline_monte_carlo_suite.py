@@ -8,6 +8,9 @@ import subprocess
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
+from functools import lru_cache
+
+from in_process import run_in_process
 
 
 REQUIRED_CSVS = [
@@ -27,6 +30,7 @@ def ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=1)
 def project_root() -> Path:
     # This file lives in ./simulations, so root is parent of this file's parent
     return Path(__file__).resolve().parent.parent
@@ -44,6 +48,16 @@ def run_script(script_rel: str, env: dict, cwd: Path) -> int:
     return r.returncode
 
 
+def run_script_in_process(script_rel: str, env: dict, cwd: Path) -> int | None:
+    """
+    Runs a simulation script inside this interpreter, as `python script` would.
+    Returns exit code, or None if the script cannot run here (see
+    run_in_process); the caller then falls back to a subprocess.
+    """
+    print(f"▶ Running (in-process): {script_rel}")
+    return run_in_process((cwd / script_rel).resolve(), [script_rel], env=env, cwd=cwd)
+
+
 def copy_if_exists(src_dir: Path, dst_dir: Path, name: str) -> bool:
     src = src_dir / name
     dst = dst_dir / name
@@ -96,6 +110,11 @@ def main() -> int:
         action="store_true",
         help="Do not run heavy simulation scripts; only ensure CSVs exist (placeholders).",
     )
+    ap.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Launch every simulation script in its own interpreter instead of in-process.",
+    )
     args = ap.parse_args()
 
     run_id = args.run_id or utc_run_id()
@@ -130,7 +149,9 @@ def main() -> int:
         ]
 
         for s in scripts:
-            rc = run_script(s, env=env, cwd=root)
+            rc = None if args.isolated else run_script_in_process(s, env=env, cwd=root)
+            if rc is None:
+                rc = run_script(s, env=env, cwd=root)
             if rc != 0:
                 print(f"⚠️ Script failed (rc={rc}): {s} — continuing (no hard fail).")
 
@@ -2,20 +2,28 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import io
 import os
 import shutil
+import stat
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
 
-# Headless-safe charts in Docker
+# Headless-safe charts in Docker (chart Figures are created lazily, only
+# when there is something to chart)
 import matplotlib
 
 matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+
+from in_process import run_in_process
 
 
 VERSION = "1.0.0"
@@ -38,81 +46,242 @@ EXTRA_REQUIRED = [
 
 ALL_REQUIRED = REQUIRED_CSVS + EXTRA_REQUIRED
 
+# Placeholder content per required CSV (sellable mode), ready to write as-is
+PLACEHOLDER_CSVS: dict[str, bytes] = {
+    "airline_board_decisions.csv": (
+        b"flight,class,RAROC,probability_of_loss,survival,board_decision\n"
+        b"FL-1001,economy,1.20,0.0000,SURVIVES,MAINTAIN\n"
+    ),
+    "airline_decision_explainability_report.csv": (
+        b"metric,value,notes\n"
+        b"model_version,1.0,placeholder-generated\n"
+    ),
+    "airline_execution_plan.csv": (
+        b"flight,class,board_decision,pricing_action,fleet_action,status\n"
+        b"FL-1001,economy,MAINTAIN,HOLD,NO CHANGE,ACTIVE\n"
+    ),
+    "airline_risk_report.csv": (
+        b"flight,class,mean_revenue,revenue_std,ci_lower_95,ci_upper_95,VaR_95,CVaR_95\n"
+        b"FL-1001,economy,22000,400,21200,22800,21500,21300\n"
+    ),
+    "airline_raroc_report.csv": (
+        b"flight,class,RAROC,decision\n"
+        b"FL-1001,economy,1.20,MAINTAIN\n"
+    ),
+    "probability_of_loss_report.csv": (
+        b"flight,class,mean_revenue,revenue_std,probability_of_loss,risk_level\n"
+        b"FL-1001,economy,22000,400,0.0000,SAFE\n"
+    ),
+    "airline_stress_test_report.csv": (
+        b"flight,class,stress_multiplier,stressed_raroc,survival\n"
+        b"FL-1001,economy,1.25,1.10,SURVIVES\n"
+    ),
+}
+
+DEFAULT_PLACEHOLDER = b"col\nplaceholder\n"
+
+# Dashboard charts, all bar charts:
+# (label, csv, kind, column, title, xlabel, ylabel, png)
+# kind "by_class": column per flight (x) and cabin class (bars)
+# kind "counts"  : value counts of column
+DASHBOARD_CHARTS = [
+    ("mean revenue", "airline_risk_report.csv", "by_class", "mean_revenue",
+     "Mean Revenue by Flight and Cabin Class", "Flight", "Mean Revenue",
+     "01_mean_revenue_by_flight_class.png"),
+    ("probability of loss", "probability_of_loss_report.csv", "by_class", "probability_of_loss",
+     "Probability of Loss by Flight and Cabin Class", "Flight", "Probability of Loss",
+     "02_probability_of_loss_by_flight_class.png"),
+    ("RAROC", "airline_raroc_report.csv", "by_class", "RAROC",
+     "RAROC by Flight and Cabin Class", "Flight", "RAROC",
+     "03_raroc_by_flight_class.png"),
+    ("board decisions", "airline_board_decisions.csv", "counts", "board_decision",
+     "Board Decision Distribution", "Decision", "Count",
+     "04_board_decision_distribution.png"),
+    ("fleet actions", "airline_execution_plan.csv", "counts", "fleet_action",
+     "Fleet Action Distribution", "Fleet Action", "Count",
+     "05_fleet_action_distribution.png"),
+]
+
+CHART_FIGSIZE = {"by_class": (11, 5), "counts": (9, 4.5)}
+
+# Pipeline stages -> stages whose outputs they read (declared in serial order).
+# Stages whose inputs are all ready run concurrently unless --serial is given.
+PIPELINE: dict[str, list[str]] = {
+    "simulations/ticket_lifecycle_simulator.py": [],
+    "simulations/monte_carlo_kpi_dashboard.py": [],
+    "simulations/airline_risk_engine.py": [
+        "simulations/monte_carlo_kpi_dashboard.py",
+    ],
+    "simulations/probability_of_loss_engine.py": [
+        "simulations/airline_risk_engine.py",
+    ],
+    "simulations/airline_raroc_engine.py": [
+        "simulations/airline_risk_engine.py",
+    ],
+    "simulations/airline_stress_test_engine.py": [
+        "simulations/airline_raroc_engine.py",
+        "simulations/probability_of_loss_engine.py",
+    ],
+    "simulations/airline_board_decision_engine.py": [
+        "simulations/airline_risk_engine.py",
+        "simulations/probability_of_loss_engine.py",
+        "simulations/airline_raroc_engine.py",
+        "simulations/airline_stress_test_engine.py",
+    ],
+    "simulations/airline_execution_engine.py": [
+        "simulations/airline_board_decision_engine.py",
+    ],
+    "simulations/airline_decision_explainability_engine.py": [
+        "simulations/airline_board_decision_engine.py",
+        "simulations/airline_execution_engine.py",
+        "simulations/probability_of_loss_engine.py",
+        "simulations/airline_raroc_engine.py",
+    ],
+}
+
+
+@lru_cache(maxsize=1)
+def _utc_second_str(second: int) -> str:
+    return datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
+
 
 def utc_now_str() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
+    # Second resolution: each wall-clock second is formatted only once
+    return _utc_second_str(int(time.time()))
 
 
 def ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=1)
 def repo_root() -> Path:
     # This file lives at /app/simulations/run_full_pipeline.py inside the image
     return Path(__file__).resolve().parents[1]
 
 
-def _append_log(log_file: Path, text: str) -> None:
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-    with log_file.open("a", encoding="utf-8") as f:
-        f.write(text)
+def _probe(path: Path) -> tuple[bool, int]:
+    """
+    One stat() call: (is a regular file, size in bytes).
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return False, 0
+    return stat.S_ISREG(st.st_mode), st.st_size
 
 
-def run_script(
-    script_rel: str,
-    *,
-    env: dict[str, str] | None = None,
-    cwd: Path | None = None,
-    extra_args: list[str] | None = None,
-    log_file: Path | None = None,
-) -> int:
+def _fast_copy(src: Path, dst: Path, size: int) -> None:
     """
-    PRO runner:
-    - Captures stdout/stderr always
-    - Logs every command, RC, stdout, stderr to pipeline_debug.log
-    - Uses cwd=/app by default so scripts that rely on repo-relative paths do not break
+    shutil.copy2 equivalent that copies the data in-kernel with
+    copy_file_range (a reflink on CoW filesystems) when available.
+    Falls back to shutil.copy2 (sendfile on Linux) otherwise.
     """
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is not None:
+        try:
+            with src.open("rb") as s, dst.open("wb") as d:
+                remaining = size
+                while remaining > 0:
+                    n = copy_range(s.fileno(), d.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+
+    shutil.copy2(src, dst)
+
+
+@lru_cache(maxsize=None)
+def _log_handle(log_file: Path) -> io.TextIOWrapper:
+    """
+    One append handle per log file for the life of the run (closed at
+    interpreter exit). Line-buffered, so every record and streamed output
+    line is on disk as soon as it is written, even if the run is killed.
+    """
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    f = log_file.open("a", encoding="utf-8", buffering=1)
+    atexit.register(f.close)
+    return f
+
+
+def _append_log(log_file: Path, text: str) -> None:
+    _log_handle(log_file).write(text)
+
+
+def _script_cmd(script_rel: str, extra_args: list[str] | None = None) -> list[str]:
     cmd = [sys.executable, script_rel]
     if extra_args:
         cmd.extend(extra_args)
+    return cmd
 
-    cwd_use = cwd if cwd is not None else repo_root()
 
-    print(f"▶ Running: {' '.join(cmd)}")
+def _execute(cmd: list[str], *, env: dict[str, str] | None, cwd: Path) -> subprocess.CompletedProcess | Exception:
     try:
-        p = subprocess.run(
+        return subprocess.run(
             cmd,
             env=env,
-            cwd=str(cwd_use),
+            cwd=str(cwd),
             text=True,
             capture_output=True,
         )
+    except Exception as e:
+        return e
 
-        # Print to console
-        if p.stdout:
-            print(p.stdout.rstrip())
-        if p.stderr:
-            print(p.stderr.rstrip())
 
-        # Write to debug log
-        if log_file is not None:
-            _append_log(
-                log_file,
-                "\n"
-                + "=" * 90
-                + "\n"
-                + f"TIME: {utc_now_str()}\n"
-                + f"CMD : {' '.join(cmd)}\n"
-                + f"CWD : {cwd_use}\n"
-                + f"RC  : {p.returncode}\n"
-                + ("--- STDOUT ---\n" + p.stdout + "\n" if p.stdout else "")
-                + ("--- STDERR ---\n" + p.stderr + "\n" if p.stderr else "")
-            )
+def _execute_in_process(
+    script_rel: str,
+    cmd: list[str],
+    *,
+    env: dict[str, str] | None,
+    cwd: Path,
+) -> subprocess.CompletedProcess | None:
+    """
+    Run a script inside this interpreter exactly as `python script args...`
+    would, capturing stdout/stderr. Saves an interpreter start and the
+    pandas/matplotlib imports.
+
+    Returns None if the script cannot run here (see run_in_process), so the
+    caller can fall back to a subprocess.
+    """
+    out, err = io.StringIO(), io.StringIO()
+
+    # rc_context: style changes made by a script (e.g. sns.set) must not
+    # leak into the pipeline's own charts
+    with matplotlib.rc_context():
+        rc = run_in_process(
+            (cwd / script_rel).resolve(),
+            [script_rel, *cmd[2:]],
+            env=env,
+            cwd=cwd,
+            stdout=out,
+            stderr=err,
+        )
+    if rc is None:
+        return None
 
-        return int(p.returncode)
+    return subprocess.CompletedProcess(cmd, rc, out.getvalue(), err.getvalue())
 
-    except Exception as e:
-        msg = f"⚠️ Script launcher failed: {script_rel}: {e}\n"
+
+def _report(
+    script_rel: str,
+    cmd: list[str],
+    cwd: Path,
+    outcome: subprocess.CompletedProcess | Exception,
+    log_file: Path | None,
+    *,
+    in_process: bool = False,
+) -> int:
+    """
+    Print captured output and append the run record to pipeline_debug.log.
+    Returns the script's exit code (1 if it could not be launched).
+    """
+    if isinstance(outcome, Exception):
+        msg = f"⚠️ Script launcher failed: {script_rel}: {outcome}\n"
         print(msg.rstrip())
         if log_file is not None:
             _append_log(
@@ -122,10 +291,174 @@ def run_script(
                 + "\n"
                 + f"TIME: {utc_now_str()}\n"
                 + f"CMD : {' '.join(cmd)}\n"
-                + f"EXC : {e}\n"
+                + f"EXC : {outcome}\n"
             )
         return 1
 
+    p = outcome
+
+    # Print to console
+    if p.stdout:
+        print(p.stdout.rstrip())
+    if p.stderr:
+        print(p.stderr.rstrip())
+
+    # Write to debug log
+    if log_file is not None:
+        _append_log(
+            log_file,
+            "\n"
+            + "=" * 90
+            + "\n"
+            + f"TIME: {utc_now_str()}\n"
+            + f"CMD : {' '.join(cmd)}\n"
+            + ("MODE: in-process\n" if in_process else "")
+            + f"CWD : {cwd}\n"
+            + f"RC  : {p.returncode}\n"
+            + ("--- STDOUT ---\n" + p.stdout + "\n" if p.stdout else "")
+            + ("--- STDERR ---\n" + p.stderr + "\n" if p.stderr else "")
+        )
+
+    return int(p.returncode)
+
+
+def _run_streaming(
+    script_rel: str,
+    cmd: list[str],
+    cwd: Path,
+    *,
+    env: dict[str, str] | None,
+    log_file: Path | None,
+) -> int:
+    """
+    Run a script as a subprocess and tee its output (stderr merged into
+    stdout) line by line to the console and pipeline_debug.log, so memory
+    stays flat however much the script prints.
+    """
+    try:
+        p = subprocess.Popen(
+            cmd,
+            env=env,
+            cwd=str(cwd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+    except Exception as e:
+        return _report(script_rel, cmd, cwd, e, log_file)
+
+    if log_file is None:
+        with p.stdout:
+            for line in p.stdout:
+                print(line, end="")
+        return p.wait()
+
+    _append_log(
+        log_file,
+        "\n"
+        + "=" * 90
+        + "\n"
+        + f"TIME: {utc_now_str()}\n"
+        + f"CMD : {' '.join(cmd)}\n"
+        + f"CWD : {cwd}\n"
+        + "--- OUTPUT ---\n",
+    )
+    log = _log_handle(log_file)
+    with p.stdout:
+        for line in p.stdout:
+            print(line, end="")
+            log.write(line)
+    rc = p.wait()
+    log.write(f"RC  : {rc}\n")
+
+    return rc
+
+
+def run_script(
+    script_rel: str,
+    *,
+    env: dict[str, str] | None = None,
+    cwd: Path | None = None,
+    extra_args: list[str] | None = None,
+    log_file: Path | None = None,
+    in_process: bool = False,
+) -> int:
+    """
+    PRO runner:
+    - Streams stdout/stderr (subprocess) or captures them (in-process)
+    - Logs every command, RC and output to pipeline_debug.log
+    - Uses cwd=/app by default so scripts that rely on repo-relative paths do not break
+    - in_process=True runs the script in this interpreter (subprocess fallback)
+    """
+    cmd = _script_cmd(script_rel, extra_args)
+    cwd_use = cwd if cwd is not None else repo_root()
+
+    print(f"▶ Running: {' '.join(cmd)}")
+
+    if in_process:
+        outcome = _execute_in_process(script_rel, cmd, env=env, cwd=cwd_use)
+        if outcome is not None:
+            return _report(script_rel, cmd, cwd_use, outcome, log_file, in_process=True)
+        print(f"↪ {Path(script_rel).name} not importable in-process — using a subprocess")
+
+    return _run_streaming(script_rel, cmd, cwd_use, env=env, log_file=log_file)
+
+
+def run_scripts_parallel(
+    scripts: list[str],
+    *,
+    env: dict[str, str] | None = None,
+    cwd: Path | None = None,
+    log_file: Path | None = None,
+    in_process: bool = False,
+) -> list[int]:
+    """
+    Run independent scripts concurrently (one subprocess each).
+    Output is printed and logged afterwards in list order, so the console
+    and pipeline_debug.log never interleave.
+
+    A lone script may run in-process; concurrent ones always get their own
+    interpreter since cwd and stdout redirection are process-wide.
+    """
+    if len(scripts) == 1:
+        return [run_script(scripts[0], env=env, cwd=cwd, log_file=log_file, in_process=in_process)]
+
+    cmds = [_script_cmd(script) for script in scripts]
+    cwd_use = cwd if cwd is not None else repo_root()
+
+    for cmd in cmds:
+        print(f"▶ Running: {' '.join(cmd)}")
+
+    with ThreadPoolExecutor(max_workers=min(len(cmds), os.cpu_count() or 1)) as pool:
+        outcomes = list(pool.map(lambda cmd: _execute(cmd, env=env, cwd=cwd_use), cmds))
+
+    return [
+        _report(script, cmd, cwd_use, outcome, log_file)
+        for script, cmd, outcome in zip(scripts, cmds, outcomes)
+    ]
+
+
+def pipeline_layers(deps: dict[str, list[str]]) -> list[list[str]]:
+    """
+    Group stages into layers whose dependencies are all in earlier layers.
+    Declaration order is kept inside each layer.
+    """
+    layers: list[list[str]] = []
+    done: set[str] = set()
+    remaining = dict(deps)
+
+    while remaining:
+        ready = [stage for stage, needs in remaining.items() if all(n in done for n in needs)]
+        if not ready:
+            raise ValueError(f"Pipeline has unresolved dependencies: {sorted(remaining)}")
+        layers.append(ready)
+        done.update(ready)
+        for stage in ready:
+            del remaining[stage]
+
+    return layers
+
 
 def ensure_symlink(link_path: Path, target_dir: Path, *, log_file: Path | None = None) -> None:
     """
@@ -173,7 +506,8 @@ def copy_if_exists(src: Path, dst: Path) -> bool:
     Copy only if src is a real non-empty file and NOT the same file as dst.
     """
     try:
-        if not (src.exists() and src.is_file() and src.stat().st_size > 0):
+        is_file, size = _probe(src)
+        if not (is_file and size > 0):
             return False
 
         # Same-file protections
@@ -192,7 +526,7 @@ def copy_if_exists(src: Path, dst: Path) -> bool:
             pass
 
         dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, dst)
+        _fast_copy(src, dst, size)
         return True
     except Exception:
         return False
@@ -209,6 +543,30 @@ def contains_placeholder_marker(path: Path) -> bool:
         return False
 
 
+def _looks_like_csv(path: Path) -> bool:
+    """
+    Cheap readability check from the first 4 KiB only:
+    a complete header line, comma-separated, not binary.
+    """
+    with path.open("rb") as fh:
+        head = fh.read(4096)
+    return b"\n" in head and b"," in head and b"\x00" not in head
+
+
+def _csv_readable(path: Path) -> bool:
+    """
+    True if pandas can read the CSV header. The full file is never parsed;
+    pandas is only consulted (header only) when the cheap sniff is unsure.
+    """
+    if _looks_like_csv(path):
+        return True
+    try:
+        pd.read_csv(path, nrows=0)
+        return True
+    except ValueError:  # EmptyDataError, ParserError, UnicodeDecodeError
+        return False
+
+
 def write_or_repair_placeholders(dashboard_dir: Path) -> None:
     """
     Sellable mode guarantee:
@@ -220,54 +578,23 @@ def write_or_repair_placeholders(dashboard_dir: Path) -> None:
     """
     ensure_dir(dashboard_dir)
 
-    placeholders = {
-        "airline_board_decisions.csv": (
-            "flight,class,RAROC,probability_of_loss,survival,board_decision\n"
-            "FL-1001,economy,1.20,0.0000,SURVIVES,MAINTAIN\n"
-        ),
-        "airline_decision_explainability_report.csv": (
-            "metric,value,notes\n"
-            "model_version,1.0,placeholder-generated\n"
-        ),
-        "airline_execution_plan.csv": (
-            "flight,class,board_decision,pricing_action,fleet_action,status\n"
-            "FL-1001,economy,MAINTAIN,HOLD,NO CHANGE,ACTIVE\n"
-        ),
-        "airline_risk_report.csv": (
-            "flight,class,mean_revenue,revenue_std,ci_lower_95,ci_upper_95,VaR_95,CVaR_95\n"
-            "FL-1001,economy,22000,400,21200,22800,21500,21300\n"
-        ),
-        "airline_raroc_report.csv": (
-            "flight,class,RAROC,decision\n"
-            "FL-1001,economy,1.20,MAINTAIN\n"
-        ),
-        "probability_of_loss_report.csv": (
-            "flight,class,mean_revenue,revenue_std,probability_of_loss,risk_level\n"
-            "FL-1001,economy,22000,400,0.0000,SAFE\n"
-        ),
-        "airline_stress_test_report.csv": (
-            "flight,class,stress_multiplier,stressed_raroc,survival\n"
-            "FL-1001,economy,1.25,1.10,SURVIVES\n"
-        ),
-    }
-
     for fname in ALL_REQUIRED:
         f = dashboard_dir / fname
 
-        if not f.exists():
-            f.write_text(placeholders.get(fname, "col\nplaceholder\n"), encoding="utf-8")
+        exists, size = _probe(f)
+
+        if not exists:
+            f.write_bytes(PLACEHOLDER_CSVS.get(fname, DEFAULT_PLACEHOLDER))
             print(f"🧩 Created placeholder (missing): {fname}")
             continue
 
-        if f.stat().st_size < 10:
-            f.write_text(placeholders.get(fname, "col\nplaceholder\n"), encoding="utf-8")
+        if size < 10:
+            f.write_bytes(PLACEHOLDER_CSVS.get(fname, DEFAULT_PLACEHOLDER))
             print(f"🧩 Repaired placeholder (too small): {fname}")
             continue
 
-        try:
-            pd.read_csv(f)
-        except Exception:
-            f.write_text(placeholders.get(fname, "col\nplaceholder\n"), encoding="utf-8")
+        if not _csv_readable(f):
+            f.write_bytes(PLACEHOLDER_CSVS.get(fname, DEFAULT_PLACEHOLDER))
             print(f"🧩 Repaired placeholder (unreadable): {fname}")
 
 
@@ -277,8 +604,16 @@ def csv_rowcount(path: Path) -> int:
     Returns 0 on failure.
     """
     try:
-        with path.open("r", encoding="utf-8") as f:
-            lines = sum(1 for _ in f)
+        # Count newlines in 1 MiB binary blocks (bytes.count is a C scan);
+        # a final line without a trailing newline still counts as a row
+        lines = 0
+        last = b""
+        with path.open("rb") as f:
+            while block := f.read(1 << 20):
+                lines += block.count(b"\n")
+                last = block
+        if last and not last.endswith(b"\n"):
+            lines += 1
         return max(0, lines - 1)
     except Exception:
         return 0
@@ -339,7 +674,57 @@ def _safe_save(fig, out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
     fig.tight_layout()
     fig.savefig(out_path, dpi=160, bbox_inches="tight")
-    plt.close(fig)
+
+
+def _chart_columns(kind: str, column: str) -> set[str]:
+    return {"flight", "class", column} if kind == "by_class" else {column}
+
+
+def _chart_data(df: pd.DataFrame, kind: str, column: str) -> pd.DataFrame | pd.Series | None:
+    """
+    Shape a report into what its bar chart plots; None if columns are missing.
+    """
+    if not _chart_columns(kind, column).issubset(df.columns):
+        return None
+
+    if kind == "by_class":
+        # groupby/unstack: same sorted flight x class table as pivot, without
+        # pivot's extra uniqueness pass (a duplicate pair keeps its first value)
+        return df.groupby(["flight", "class"])[column].first().unstack("class")
+
+    return df[column].value_counts().sort_index()
+
+
+def _render_chart(chart: tuple, dashboard_dir: Path, images_dir: Path) -> Path | None:
+    """
+    Render one DASHBOARD_CHARTS entry to PNG. Returns the PNG path, or None
+    if the report lacks the chart's columns.
+
+    Draws on a standalone Figure (no pyplot state), so charts can render
+    concurrently on separate threads.
+    """
+    from matplotlib.figure import Figure
+
+    _label, csv_name, kind, column, title, xlabel, ylabel, png = chart
+
+    # Parse only the chart's columns; a callable never raises
+    # on missing ones, _chart_data skips those charts
+    wanted = _chart_columns(kind, column)
+    df = pd.read_csv(dashboard_dir / csv_name, usecols=lambda c: c in wanted)
+    data = _chart_data(df, kind, column)
+    if data is None:
+        return None
+
+    fig = Figure(figsize=CHART_FIGSIZE[kind])
+    ax = fig.add_subplot(111)
+    data.plot(kind="bar", ax=ax)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+
+    out = images_dir / png
+    _safe_save(fig, out)
+    return out
 
 
 def generate_dashboard_charts(dashboard_dir: Path, *, log_file: Path | None = None) -> int:
@@ -358,105 +743,23 @@ def generate_dashboard_charts(dashboard_dir: Path, *, log_file: Path | None = No
         if log_file is not None:
             _append_log(log_file, "\n" + msg + "\n")
 
-    # ---- Chart 1: Mean revenue by flight/class from airline_risk_report.csv
-    risk_csv = dashboard_dir / "airline_risk_report.csv"
-    if risk_csv.exists():
-        try:
-            df = pd.read_csv(risk_csv)
-            if {"flight", "class", "mean_revenue"}.issubset(df.columns):
-                pivot = df.pivot(index="flight", columns="class", values="mean_revenue")
-                fig = plt.figure(figsize=(11, 5))
-                ax = fig.add_subplot(111)
-                pivot.plot(kind="bar", ax=ax)
-                ax.set_title("Mean Revenue by Flight and Cabin Class")
-                ax.set_xlabel("Flight")
-                ax.set_ylabel("Mean Revenue")
-                out = images_dir / "01_mean_revenue_by_flight_class.png"
-                _safe_save(fig, out)
-                created += 1
-                log(f"🖼️ saved: {out}")
-        except Exception as e:
-            log(f"⚠️ chart failed (mean revenue): {e}")
+    charts = [chart for chart in DASHBOARD_CHARTS if (dashboard_dir / chart[1]).exists()]
 
-    # ---- Chart 2: Probability of loss by flight/class
-    pol_csv = dashboard_dir / "probability_of_loss_report.csv"
-    if pol_csv.exists():
-        try:
-            df = pd.read_csv(pol_csv)
-            if {"flight", "class", "probability_of_loss"}.issubset(df.columns):
-                pivot = df.pivot(index="flight", columns="class", values="probability_of_loss")
-                fig = plt.figure(figsize=(11, 5))
-                ax = fig.add_subplot(111)
-                pivot.plot(kind="bar", ax=ax)
-                ax.set_title("Probability of Loss by Flight and Cabin Class")
-                ax.set_xlabel("Flight")
-                ax.set_ylabel("Probability of Loss")
-                out = images_dir / "02_probability_of_loss_by_flight_class.png"
-                _safe_save(fig, out)
-                created += 1
-                log(f"🖼️ saved: {out}")
-        except Exception as e:
-            log(f"⚠️ chart failed (probability of loss): {e}")
+    if charts:
+        # Charts are independent (own CSV, own Figure, own PNG): render them
+        # concurrently, then log in table order
+        with ThreadPoolExecutor(max_workers=min(len(charts), os.cpu_count() or 1)) as pool:
+            futures = [pool.submit(_render_chart, chart, dashboard_dir, images_dir) for chart in charts]
 
-    # ---- Chart 3: RAROC by flight/class
-    raroc_csv = dashboard_dir / "airline_raroc_report.csv"
-    if raroc_csv.exists():
-        try:
-            df = pd.read_csv(raroc_csv)
-            if {"flight", "class", "RAROC"}.issubset(df.columns):
-                pivot = df.pivot(index="flight", columns="class", values="RAROC")
-                fig = plt.figure(figsize=(11, 5))
-                ax = fig.add_subplot(111)
-                pivot.plot(kind="bar", ax=ax)
-                ax.set_title("RAROC by Flight and Cabin Class")
-                ax.set_xlabel("Flight")
-                ax.set_ylabel("RAROC")
-                out = images_dir / "03_raroc_by_flight_class.png"
-                _safe_save(fig, out)
-                created += 1
-                log(f"🖼️ saved: {out}")
-        except Exception as e:
-            log(f"⚠️ chart failed (RAROC): {e}")
-
-    # ---- Chart 4: Board decisions distribution
-    board_csv = dashboard_dir / "airline_board_decisions.csv"
-    if board_csv.exists():
-        try:
-            df = pd.read_csv(board_csv)
-            if "board_decision" in df.columns:
-                counts = df["board_decision"].value_counts().sort_index()
-                fig = plt.figure(figsize=(9, 4.5))
-                ax = fig.add_subplot(111)
-                counts.plot(kind="bar", ax=ax)
-                ax.set_title("Board Decision Distribution")
-                ax.set_xlabel("Decision")
-                ax.set_ylabel("Count")
-                out = images_dir / "04_board_decision_distribution.png"
-                _safe_save(fig, out)
-                created += 1
-                log(f"🖼️ saved: {out}")
-        except Exception as e:
-            log(f"⚠️ chart failed (board decisions): {e}")
-
-    # ---- Chart 5: Fleet actions distribution
-    exec_csv = dashboard_dir / "airline_execution_plan.csv"
-    if exec_csv.exists():
-        try:
-            df = pd.read_csv(exec_csv)
-            if "fleet_action" in df.columns:
-                counts = df["fleet_action"].value_counts().sort_index()
-                fig = plt.figure(figsize=(9, 4.5))
-                ax = fig.add_subplot(111)
-                counts.plot(kind="bar", ax=ax)
-                ax.set_title("Fleet Action Distribution")
-                ax.set_xlabel("Fleet Action")
-                ax.set_ylabel("Count")
-                out = images_dir / "05_fleet_action_distribution.png"
-                _safe_save(fig, out)
+        for chart, future in zip(charts, futures):
+            try:
+                out = future.result()
+            except Exception as e:
+                log(f"⚠️ chart failed ({chart[0]}): {e}")
+                continue
+            if out is not None:
                 created += 1
                 log(f"🖼️ saved: {out}")
-        except Exception as e:
-            log(f"⚠️ chart failed (fleet actions): {e}")
 
     log(f"🖼️ charts_created={created} (dashboard/images)")
     return created
@@ -474,6 +777,16 @@ def main() -> int:
         action="store_true",
         help="Fail non-zero if required artifacts look like placeholders/small files.",
     )
+    ap.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run pipeline stages one at a time instead of in dependency layers.",
+    )
+    ap.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Launch every pipeline stage in its own interpreter instead of in-process.",
+    )
 
     args = ap.parse_args()
 
@@ -511,24 +824,24 @@ def main() -> int:
 
     _write_run_metadata(run_dir, run_id=run_id, flights=flights, tickets_per_flight=tpf, seed=seed)
 
-    pipeline = [
-        "simulations/ticket_lifecycle_simulator.py",
-        "simulations/monte_carlo_kpi_dashboard.py",
-        "simulations/airline_risk_engine.py",
-        "simulations/probability_of_loss_engine.py",
-        "simulations/airline_raroc_engine.py",
-        "simulations/airline_stress_test_engine.py",
-        "simulations/airline_board_decision_engine.py",
-        "simulations/airline_execution_engine.py",
-        "simulations/airline_decision_explainability_engine.py",
-    ]
+    if args.serial:
+        layers = [[script] for script in PIPELINE]
+    else:
+        layers = pipeline_layers(PIPELINE)
 
     rc_any = 0
-    for script in pipeline:
-        rc = run_script(script, env=env, cwd=repo_root(), log_file=debug_log)
-        if rc != 0:
-            rc_any = rc_any or rc
-            print(f"⚠️ {Path(script).name} failed — continuing (sellable mode). See {debug_log}")
+    for layer in layers:
+        rcs = run_scripts_parallel(
+            layer,
+            env=env,
+            cwd=repo_root(),
+            log_file=debug_log,
+            in_process=not args.isolated,
+        )
+        for script, rc in zip(layer, rcs):
+            if rc != 0:
+                rc_any = rc_any or rc
+                print(f"⚠️ {Path(script).name} failed — continuing (sellable mode). See {debug_log}")
 
     # ---------------------------------------------------------------------
     # Deterministic artifact copy (NO GLOBS)
@@ -561,7 +874,8 @@ def main() -> int:
     print("\n📊 Generating charts into dashboard/images/ ...\n")
     charts_created = generate_dashboard_charts(dashboard_dir, log_file=debug_log)
 
-    # CEO PDF generation (must pass args)
+    # CEO PDF generation (must pass args). In-process by default: pandas and
+    # matplotlib are already loaded here; reportlab missing -> subprocess.
     print("\n🧾 Generating CEO PDF...\n")
     rc_pdf = run_script(
         "simulations/airline_ceo_pdf_report.py",
@@ -569,6 +883,7 @@ def main() -> int:
         cwd=repo_root(),
         extra_args=["--dashboard", str(dashboard_dir), "--out", str(reports_dir)],
         log_file=debug_log,
+        in_process=not args.isolated,
     )
     if rc_pdf != 0:
         print(f"⚠️ CEO PDF generator failed — continuing (sellable mode). See {debug_log}")
@@ -584,8 +899,9 @@ def main() -> int:
 
     for name in ALL_REQUIRED:
         f = dashboard_dir / name
-        rows = csv_rowcount(f) if f.exists() else 0
-        placeholder_flag = contains_placeholder_marker(f) if f.exists() else True
+        exists, _size = _probe(f)
+        rows = csv_rowcount(f) if exists else 0
+        placeholder_flag = contains_placeholder_marker(f) if exists else True
         status = "OK" if (rows > STRICT_MIN_ROWS and not placeholder_flag) else "PLACEHOLDER/SMALL"
         print(f" - {name:<35} rows={rows:<6} status={status}")
 
@@ -595,7 +911,8 @@ def main() -> int:
             if placeholder_flag:
                 problems.append(f"{name} contains placeholder marker")
 
-    if pdf_path.exists() and pdf_path.stat().st_size > 1000:
+    pdf_exists, pdf_size = _probe(pdf_path)
+    if pdf_exists and pdf_size > 1000:
         print(" - EXECUTIVE_REPORT.pdf                     status=OK")
     else:
         print(" - EXECUTIVE_REPORT.pdf                     status=MISSING/SMALL")
@@ -0,0 +1,15 @@
+# simulations/ticket_identifiers.py
+import numpy as np
+
+
+def ticket_identifiers(flight_id: str, count: int) -> tuple[list[str], list[str]]:
+    """
+    Ticket and passenger IDs for tickets 1..count, built in one vectorized pass.
+    """
+    if count <= 0:
+        return [], []
+
+    suffix = np.char.zfill(np.arange(1, count + 1).astype(str), 4)
+    ticket_ids = np.char.add(f"{flight_id}-T", suffix)
+    passenger_ids = np.char.add(f"PASS-{flight_id}-", suffix)
+    return ticket_ids.tolist(), passenger_ids.tolist()
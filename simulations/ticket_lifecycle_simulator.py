@@ -1,33 +1,59 @@
 # simulations/ticket_lifecycle_simulator.py
-import random
+import numpy as np
 from domain.ticket.model import Ticket
+from infrastructure.simulation_seed import simulation_seed
 from infrastructure.event_repository import EventRepository
 
 TICKETS_PER_FLIGHT = 5
 FLIGHTS = [f"flight_FL-{1000 + i}" for i in range(1, 11)]
+PRICE_RANGE = (100, 500)
 
-def simulate_ticket_lifecycle(flight_id: str):
+SEED = simulation_seed()
+
+def simulate_ticket_lifecycle(
+    flight_id: str,
+    prices: list[float],
+    payments: list[float],
+    repo: EventRepository,
+):
+    """
+    Runs every ticket of one flight through its lifecycle using pre-drawn
+    prices/payments, then persists the flight's events in one bulk write
+    through the run's shared repository.
+    """
     tickets = []
-    for i in range(1, TICKETS_PER_FLIGHT + 1):
-        ticket_id = f"{flight_id}_T{i}"
-        ticket = Ticket(ticket_id=ticket_id, flight_id=flight_id)
-        ticket.issue(price=random.uniform(100, 500))
-        ticket.pay(amount=random.uniform(100, 500))
+    for i, (price, amount) in enumerate(zip(prices, payments), start=1):
+        ticket = Ticket(ticket_id=f"{flight_id}_T{i}", flight_id=flight_id)
+        ticket.issue(price=price)
+        ticket.pay(amount=amount)
         ticket.check_in()
         ticket.board()
         ticket.close()
         tickets.append(ticket)
 
-        # Save events to logs
-        for event in ticket.events:
-            repo = EventRepository()
-            repo.save_event(flight_id, event)
+    # Save events to logs
+    repo.save_events_bulk(flight_id, (event for ticket in tickets for event in ticket.events))
 
     return tickets
 
+def simulate_flight(flight_id: str, seed_seq: np.random.SeedSequence, repo: EventRepository) -> None:
+    """
+    Draws one flight's prices/payments from its own seed and runs its
+    lifecycle.
+    """
+    flight_rng = np.random.default_rng(seed_seq)
+    prices = flight_rng.uniform(*PRICE_RANGE, size=TICKETS_PER_FLIGHT).tolist()
+    payments = flight_rng.uniform(*PRICE_RANGE, size=TICKETS_PER_FLIGHT).tolist()
+    simulate_ticket_lifecycle(flight_id, prices, payments, repo)
+
 def run_simulation():
-    for flight_id in FLIGHTS:
-        simulate_ticket_lifecycle(flight_id)
+    # One repository for the run
+    repo = EventRepository()
+
+    # One child seed per flight: a flight's draws depend only on SEED
+    seeds = np.random.SeedSequence(SEED).spawn(len(FLIGHTS))
+    for flight_id, seed_seq in zip(FLIGHTS, seeds):
+        simulate_flight(flight_id, seed_seq, repo)
 
 if __name__ == "__main__":
     run_simulation()
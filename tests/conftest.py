@@ -0,0 +1,12 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Repo root first (as PYTHONPATH=. does), then simulations/ for the engines.
+# Both hold a ticket_lifecycle_simulator module; the root one must win.
+for path in (str(ROOT), str(ROOT / "simulations")):
+    if path in sys.path:
+        sys.path.remove(path)
+sys.path.insert(0, str(ROOT))
+sys.path.append(str(ROOT / "simulations"))
@@ -0,0 +1,41 @@
+import pytest
+
+from run_full_pipeline import csv_rowcount
+
+
+def text_rowcount(path):
+    # The original line-by-line count
+    with path.open("r", encoding="utf-8") as f:
+        return max(0, sum(1 for _ in f) - 1)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "a,b\n",
+        "a,b",
+        "a,b\n1,2\n3,4\n",
+        "a,b\n1,2\n3,4",
+        "a,b\r\n1,2\r\n",
+        "a,b\n\n1,2\n",
+    ],
+)
+def test_matches_line_count(tmp_path, content):
+    path = tmp_path / "x.csv"
+    path.write_bytes(content.encode())
+
+    assert csv_rowcount(path) == text_rowcount(path)
+
+
+def test_rows_spanning_read_blocks(tmp_path):
+    path = tmp_path / "big.csv"
+    row = "FL-1001,economy," + "9" * 40 + "\n"
+    path.write_text("flight,class,value\n" + row * 60_000 + row.rstrip("\n"))
+
+    assert path.stat().st_size > 2 * (1 << 20)
+    assert csv_rowcount(path) == 60_001
+
+
+def test_missing_file_counts_zero(tmp_path):
+    assert csv_rowcount(tmp_path / "missing.csv") == 0
@@ -0,0 +1,56 @@
+import pandas as pd
+import pytest
+
+import airline_early_warning_engine as ew
+
+LEDGER = (
+    [("FL-1", "economy", t) for t in ["Human Override", "Stress Exposure", "Human Override", "Delay"]]
+    + [("FL-1", "first", t) for t in ["Accepted High Loss Probability", "A", "B", "C", "D"]]
+    + [("FL-2", "economy", f"T{i}") for i in range(10)]
+)
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    # Interleave the groups so every chunk holds parts of several of them
+    rows = LEDGER[::2] + LEDGER[1::2]
+    path = tmp_path / "ledger.csv"
+    pd.DataFrame(rows, columns=["flight", "class", "incident_type"]).assign(note="x").to_csv(path, index=False)
+    return path
+
+
+def test_chunked_counts_match_a_whole_file_read(ledger, monkeypatch):
+    monkeypatch.setattr(ew, "LEDGER_CHUNK_ROWS", 3)
+
+    totals, by_type = ew.incident_counts(ledger)
+
+    whole = pd.read_csv(ledger)
+    pd.testing.assert_series_equal(totals, whole.groupby(["flight", "class"]).size(), check_names=False)
+    expected = pd.crosstab([whole["flight"], whole["class"]], whole["incident_type"])
+    pd.testing.assert_frame_equal(by_type.sort_index(axis=1), expected.sort_index(axis=1), check_names=False)
+
+
+def test_empty_ledger_gives_empty_counts(tmp_path):
+    path = tmp_path / "ledger.csv"
+    path.write_text("flight,class,incident_type\n")
+
+    totals, by_type = ew.incident_counts(path)
+
+    assert totals.empty and by_type.empty
+
+
+def test_signals_flag_only_groups_over_threshold(ledger, monkeypatch):
+    monkeypatch.setattr(ew, "LEDGER_CHUNK_ROWS", 3)
+
+    signals = ew.detect_signals(*ew.incident_counts(ledger))
+
+    assert signals[["flight", "class"]].values.tolist() == [["FL-1", "economy"], ["FL-1", "first"]]
+    economy, first = signals.to_dict("records")
+    assert economy["override_rate"] == 0.5
+    assert economy["stress_exposure_rate"] == 0.25
+    assert economy["total_incidents"] == 4
+    assert economy["warnings"] == (
+        "Excessive human overrides; Recurring stress exposure; Repeated incident pattern detected"
+    )
+    assert first["high_loss_acceptance_rate"] == 0.2
+    assert first["warnings"] == "Repeated acceptance of high-loss decisions"
@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ticket_lifecycle_stress_test import FixedClock
+
+START = datetime(2026, 1, 8, 12, 0, tzinfo=timezone.utc)
+
+
+def test_next_scheduled_walks_the_precomputed_readings():
+    clock = FixedClock(START)
+    clock.schedule(3, 60)
+
+    readings = [clock.now()]
+    for _ in range(3):
+        clock.next_scheduled()
+        readings.append(clock.now())
+
+    assert readings == [START + timedelta(seconds=60 * i) for i in range(4)]
+    with pytest.raises(RuntimeError):
+        clock.next_scheduled()
+
+
+def test_advance_uses_its_argument_and_drops_the_schedule():
+    clock = FixedClock(START)
+    clock.schedule(3, 60)
+
+    clock.advance(5)
+
+    assert clock.now() == START + timedelta(seconds=5)
+    with pytest.raises(RuntimeError):
+        clock.next_scheduled()
@@ -0,0 +1,92 @@
+import io
+import os
+import sys
+
+import pytest
+
+from in_process import run_in_process
+
+SCRIPTS = {
+    "raises.py": "import os, sys\nos.environ['IN_PROCESS_PROBE'] = 'set'\nraise RuntimeError('boom')\n",
+    "exits.py": "import sys\nprint(sys.argv[1:])\nsys.exit(3)\n",
+    "exits_msg.py": "import sys\nsys.exit('bad input')\n",
+    "missing.py": "import no_such_module_for_tests\nprint('RAN')\n",
+    "late_import.py": "def f():\n    import no_such_module_for_tests\nprint('RAN')\nf()\n",
+    "uses_path.py": "import os\nimport helper\nprint(helper.VALUE, os.environ['PYTHONPATH'])\n",
+}
+
+
+@pytest.fixture
+def scripts(tmp_path):
+    for name, body in SCRIPTS.items():
+        (tmp_path / name).write_text(body)
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "lib" / "helper.py").write_text("VALUE = 42\n")
+    return tmp_path
+
+
+def snapshot():
+    return sys.argv[:], sys.path[:], os.getcwd(), dict(os.environ)
+
+
+@pytest.mark.parametrize(
+    "script, argv, expected_rc",
+    [("raises.py", ["raises.py"], 1), ("exits.py", ["exits.py", "--x"], 3), ("exits_msg.py", ["exits_msg.py"], 1)],
+)
+def test_state_is_restored_after_raise_or_exit(scripts, script, argv, expected_rc):
+    before = snapshot()
+    out, err = io.StringIO(), io.StringIO()
+
+    rc = run_in_process(
+        scripts / script, argv, env={**os.environ, "EXTRA": "1"}, cwd=scripts, stdout=out, stderr=err
+    )
+
+    assert rc == expected_rc
+    assert snapshot() == before
+
+
+def test_script_sees_its_argv_and_output_is_captured(scripts):
+    out = io.StringIO()
+
+    run_in_process(scripts / "exits.py", ["exits.py", "--x"], env=None, cwd=scripts, stdout=out)
+
+    assert out.getvalue() == "['--x']\n"
+
+
+def test_non_integer_exit_code_goes_to_stderr(scripts):
+    err = io.StringIO()
+
+    run_in_process(scripts / "exits_msg.py", ["exits_msg.py"], env=None, cwd=scripts, stderr=err)
+
+    assert err.getvalue() == "bad input\n"
+
+
+def test_missing_top_level_import_returns_none_without_running(scripts):
+    out = io.StringIO()
+
+    assert run_in_process(scripts / "missing.py", ["missing.py"], env=None, cwd=scripts, stdout=out) is None
+    assert out.getvalue() == ""
+
+
+def test_import_error_after_start_is_a_failure(scripts):
+    out, err = io.StringIO(), io.StringIO()
+
+    rc = run_in_process(scripts / "late_import.py", ["late_import.py"], env=None, cwd=scripts, stdout=out, stderr=err)
+
+    assert rc == 1
+    assert out.getvalue() == "RAN\n"
+    assert "ModuleNotFoundError" in err.getvalue()
+
+
+def test_env_pythonpath_is_on_sys_path(scripts):
+    before = snapshot()
+    out = io.StringIO()
+
+    rc = run_in_process(
+        scripts / "uses_path.py", ["uses_path.py"], env={**os.environ, "PYTHONPATH": "lib"}, cwd=scripts, stdout=out
+    )
+
+    assert rc == 0
+    assert out.getvalue() == "42 lib\n"
+    assert snapshot() == before
+    sys.modules.pop("helper", None)
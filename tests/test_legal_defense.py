@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+import airline_legal_defense_engine as legal
+
+
+def test_lookup_is_dict_get_with_default():
+    values = pd.Series(["RESTRUCTURE", "UNKNOWN", "MAINTAIN", None, "GROUND IMMEDIATELY"])
+
+    result = legal.lookup(values, legal.SEVERITY_MULTIPLIER, 0.2)
+
+    assert result.tolist() == [legal.SEVERITY_MULTIPLIER.get(v, 0.2) for v in values]
+
+
+def test_exposure_matches_the_per_row_formula():
+    df = pd.DataFrame(
+        {
+            "flight": ["FL-1001", "FL-1002", "FL-1003", "FL-1004"],
+            "class": ["economy", "business", "first", "premium"],
+            "board_decision": ["GROUND IMMEDIATELY", "RESTRUCTURE", "MAINTAIN", "REVIEW"],
+        }
+    )
+
+    exposure = legal.compensation_exposure(df, legal.distance_band_codes(df["flight"]))
+
+    bands = {0: "short", 1: "medium", 2: "long"}
+    expected = [
+        legal.EU261_COMPENSATION[bands[int(f.split("-")[1]) % 3]]
+        * legal.PAX_ESTIMATE.get(c, 50)
+        * legal.SEVERITY_MULTIPLIER.get(d, 0.2)
+        for f, c, d in zip(df["flight"], df["class"], df["board_decision"])
+    ]
+    np.testing.assert_allclose(exposure, expected)
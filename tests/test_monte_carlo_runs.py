@@ -0,0 +1,24 @@
+import numpy as np
+
+from monte_carlo_runs import simulate_class_runs
+
+
+def test_runs_respect_capacity_and_fare_range():
+    revenues, load_factors, denied = simulate_class_runs(20, (500, 1000), 2000, np.random.default_rng(1))
+
+    assert revenues.shape == load_factors.shape == denied.shape == (2000,)
+    assert load_factors.max() == 100.0
+    assert load_factors.min() == 75.0  # 5 under capacity at worst
+    assert denied.min() == 0 and denied.max() == 10
+    boarded = load_factors / 100 * 20
+    assert np.all(revenues >= boarded * 500) and np.all(revenues <= boarded * 1000)
+    # Denied boardings only happen on full flights
+    assert np.all(load_factors[denied > 0] == 100.0)
+
+
+def test_same_seed_same_runs():
+    first = simulate_class_runs(150, (100, 200), 50, np.random.default_rng(7))
+    second = simulate_class_runs(150, (100, 200), 50, np.random.default_rng(7))
+
+    for a, b in zip(first, second):
+        np.testing.assert_array_equal(a, b)
@@ -0,0 +1,25 @@
+import pytest
+
+from run_full_pipeline import PIPELINE, pipeline_layers
+
+
+def test_pipeline_layers_respect_dependencies():
+    layers = pipeline_layers(PIPELINE)
+
+    position = {stage: i for i, layer in enumerate(layers) for stage in layer}
+    assert sorted(position) == sorted(PIPELINE)
+    for stage, needs in PIPELINE.items():
+        assert all(position[n] < position[stage] for n in needs)
+    assert layers[0] == [
+        "simulations/ticket_lifecycle_simulator.py",
+        "simulations/monte_carlo_kpi_dashboard.py",
+    ]
+
+
+def test_declaration_order_is_kept_inside_a_layer():
+    assert pipeline_layers({"c": [], "a": [], "b": ["c"], "d": ["a", "c"]}) == [["c", "a"], ["b", "d"]]
+
+
+def test_unresolvable_dependencies_raise():
+    with pytest.raises(ValueError, match="unresolved"):
+        pipeline_layers({"a": ["b"], "b": ["a"], "c": []})
@@ -0,0 +1,30 @@
+import pandas as pd
+
+from airline_incident_postmortem_engine import join_inputs
+
+
+def test_join_keeps_base_dtypes_when_right_has_extra_keys():
+    base = pd.DataFrame({"flight": ["FL-1", "FL-2"], "class": ["economy", "economy"], "seats": [150, 50]})
+    right = pd.DataFrame(
+        {"flight": ["FL-1", "FL-3"], "class": ["economy", "economy"], "RAROC": [1.2, 0.4]}
+    )
+
+    joined = join_inputs(base, [right])
+
+    assert joined["seats"].dtype == "int64"
+    assert joined["seats"].tolist() == [150, 50]
+    assert joined["flight"].tolist() == ["FL-1", "FL-2"]
+    assert joined["RAROC"].iloc[0] == 1.2
+    assert pd.isna(joined["RAROC"].iloc[1])
+
+
+def test_earlier_frame_wins_for_shared_columns():
+    base = pd.DataFrame({"flight": ["FL-1"], "class": ["first"], "seats": [20]})
+    first = pd.DataFrame({"flight": ["FL-1"], "class": ["first"], "decision": ["MAINTAIN"]})
+    second = pd.DataFrame({"flight": ["FL-1"], "class": ["first"], "decision": ["EXIT"], "seats": [99]})
+
+    joined = join_inputs(base, [first, pd.DataFrame(), second])
+
+    assert list(joined.columns) == ["flight", "class", "seats", "decision"]
+    assert joined.loc[0, "decision"] == "MAINTAIN"
+    assert joined.loc[0, "seats"] == 20
@@ -0,0 +1,19 @@
+import numpy as np
+
+from probability_of_loss_engine import risk_levels
+
+
+def banded(p):
+    # The original per-row rule
+    return "SAFE" if p < 0.05 else "WARNING" if p < 0.15 else "CRITICAL"
+
+
+def test_bands_match_the_per_row_rule_at_and_around_thresholds():
+    p = np.array([0.0, 0.0499, 0.05, 0.1, 0.1499, 0.15, 0.5, 1.0])
+
+    assert risk_levels(p).tolist() == [banded(x) for x in p]
+
+
+def test_nan_probability_is_critical():
+    # NaN < threshold is False in the per-row rule, so it fell through to CRITICAL
+    assert risk_levels(np.array([np.nan, 0.01])).tolist() == ["CRITICAL", "SAFE"]
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+import ticket_lifecycle_simulator as sim
+from domain.ticket.states import TicketState
+
+
+@pytest.fixture
+def flights(monkeypatch):
+    state = np.array(
+        [
+            [TicketState.CLOSED, TicketState.CANCELLED, TicketState.NO_SHOW, TicketState.CLOSED],
+            [TicketState.CANCELLED] * 4,
+        ],
+        dtype=np.int8,
+    )
+    data = {
+        "flight": ["FL-1", "FL-2"],
+        "state": state,
+        "price": np.array([[100.0, 200.0, 300.0, 400.0], [50.0, 50.0, 50.0, 50.0]]),
+        "no_show": state == TicketState.NO_SHOW,
+    }
+    monkeypatch.setattr(sim, "flights_data", data)
+    return data
+
+
+def test_stage_counts_include_cancelled_and_no_show(flights):
+    report = sim.compute_kpis()
+
+    assert report["Flight"] == ["FL-1", "FL-2"]
+    assert report["Tickets issued"].tolist() == [4, 4]
+    assert report["Tickets paid"].tolist() == [4, 4]
+    assert report["Checked-in"].tolist() == [3, 0]
+    assert report["Boarded"].tolist() == [2, 0]
+    assert report["Closed"].tolist() == [2, 0]
+
+
+def test_revenue_and_rates(flights):
+    report = sim.compute_kpis()
+
+    # Only tickets still PAID or later earn revenue: FL-1's cancelled (200)
+    # and no-show (300) fares are out, as is all of FL-2
+    assert report["Revenue"].tolist() == [500.0, 0.0]
+    assert report["Load factor"].tolist() == [2 / sim.SEATS_PER_FLIGHT * 100, 0.0]
+    assert report["Completion rate"].tolist() == [50.0, 0.0]
+    assert report["No-show rate"].tolist() == [25.0, 0.0]
+
+
+def test_report_rows_follow_kpi_fields(flights):
+    rows = sim.report_rows(sim.compute_kpis())
+
+    assert rows[0][0] == "FL-1"
+    assert len(rows[0]) == 1 + len(sim.KPI_FIELDS)
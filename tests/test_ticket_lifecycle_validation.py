@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+import ticket_lifecycle_simulator as sim
+from domain.ticket.states import TicketState
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch):
+    monkeypatch.setattr(sim, "flights_data", {})
+    monkeypatch.setattr(sim, "rng", np.random.default_rng(7))
+    # Enough cancellations and no-shows that every branch is replayed
+    monkeypatch.setattr(sim, "CANCEL_PROB", 0.2)
+    monkeypatch.setattr(sim, "NO_SHOW_PROB", 0.2)
+
+
+def test_validated_run_matches_the_domain_model():
+    sim.simulate_ticket_lifecycle(["FL-1", "FL-2"], validate=True)
+
+    state = sim.flights_data["state"]
+    assert state.shape == (2, sim.TICKETS_PER_FLIGHT)
+    assert {TicketState.CANCELLED, TicketState.NO_SHOW, TicketState.CLOSED} <= set(state.ravel().tolist())
+
+
+def test_validate_flight_rejects_a_state_the_ticket_cannot_reach():
+    state = np.array([TicketState.CLOSED, TicketState.BOARDED], dtype=np.int8)
+    prices = np.array([100.0, 200.0])
+    no_show = np.zeros(2, dtype=bool)
+
+    with pytest.raises(ValueError, match="FL-1_T2"):
+        sim.validate_flight("FL-1", state, prices, no_show)
+
+
+def test_validate_flight_checks_the_no_show_flag():
+    state = np.array([TicketState.NO_SHOW], dtype=np.int8)
+
+    with pytest.raises(ValueError, match="no_show_flag"):
+        sim.validate_flight("FL-1", state, np.array([100.0]), np.zeros(1, dtype=bool))
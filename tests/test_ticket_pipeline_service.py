@@ -0,0 +1,84 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from application.commands.board_ticket import BoardTicket
+from application.commands.check_in_ticket import CheckInTicket
+from application.commands.close_ticket import CloseTicket
+from application.services.board_service import BoardService
+from application.services.check_in_service import CheckInService
+from application.services.close_service import CloseService
+from application.services.ticket_pipeline_service import TicketPipelineService
+from domain.common.errors import FlightUnavailable, InvariantViolation
+from domain.common.identifiers import FlightId, TicketNumber
+from domain.common.time import Clock
+from domain.flight.model import Flight
+from domain.ticket.model import Ticket
+from domain.ticket.states import TicketState
+
+NOW = datetime(2026, 1, 8, 12, 0, tzinfo=timezone.utc)
+
+
+class FixedClock(Clock):
+    def now(self) -> datetime:
+        return NOW
+
+
+def make_flight() -> Flight:
+    return Flight(
+        flight_id=FlightId("FL-2001"),
+        origin="NDJ",
+        destination="FNA",
+        departure_time=datetime(2026, 1, 8, 14, 0, tzinfo=timezone.utc),
+        arrival_time=datetime(2026, 1, 8, 16, 0, tzinfo=timezone.utc),
+        aircraft_id="AC-737",
+    )
+
+
+def test_full_lifecycle_closes_ticket_at_one_instant():
+    ticket = TicketPipelineService(FixedClock()).run_full_lifecycle(
+        make_flight(), TicketNumber("TCK-0001"), "PASS-0001", 250.0
+    )
+
+    assert ticket.state == TicketState.CLOSED
+    assert ticket.flight_id == "FL-2001"
+    assert [e.event_type for e in ticket.events] == ["issued", "paid", "checked_in", "boarded", "closed"]
+    assert {e.occurred_at for e in ticket.events} == {NOW}
+
+
+def test_blank_passenger_is_rejected():
+    with pytest.raises(InvariantViolation):
+        TicketPipelineService(FixedClock()).run_full_lifecycle(
+            make_flight(), TicketNumber("TCK-0003"), "  ", 250.0
+        )
+
+
+def test_cancelled_flight_is_not_bookable():
+    with pytest.raises(FlightUnavailable):
+        TicketPipelineService(FixedClock()).run_full_lifecycle(
+            make_flight().cancel(), TicketNumber("TCK-0004"), "PASS-0004", 250.0
+        )
+
+
+def test_step_services_stamp_events_with_clock_time():
+    clock = FixedClock()
+    number = TicketNumber("TCK-0005")
+    ticket = Ticket(ticket_id=number.value, flight_id="FL-2001")
+    ticket.issue(250.0)
+    ticket.pay(250.0)
+
+    CheckInService(clock).execute(ticket, CheckInTicket(number))
+    BoardService(clock).execute(ticket, BoardTicket(number))
+    CloseService(clock).execute(ticket, CloseTicket(number))
+
+    assert ticket.state == TicketState.CLOSED
+    assert [e.occurred_at for e in ticket.events[2:]] == [NOW, NOW, NOW]
+
+
+def test_timestamp_is_keyword_only():
+    ticket = Ticket(ticket_id="TCK-0006", flight_id="FL-2001")
+
+    with pytest.raises(TypeError):
+        ticket.issue(250.0, NOW)
+    with pytest.raises(TypeError):
+        ticket.check_in(FixedClock())
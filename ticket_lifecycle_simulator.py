@@ -1,9 +1,14 @@
-import random
+import io
+import sys
 from datetime import datetime, timedelta
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import csv
+import numpy as np
 from domain.ticket.model import Ticket
-from infrastructure.event_repository import save_event  # if you use it
+from infrastructure.simulation_seed import simulation_seed
+from domain.ticket.states import TicketState
 
 # -----------------------
 # Simulation Parameters
@@ -15,135 +20,198 @@ TICKET_PRICE_RANGE = (100, 500)  # min and max ticket price
 NO_SHOW_PROB = 0.05  # probability of no-show
 CANCEL_PROB = 0.03   # probability of cancellation
 
+SEED = simulation_seed()
+
+rng = np.random.default_rng(SEED)
+
+# Furthest lifecycle stage each TicketState has been through, indexed by
+# state + STATE_OFFSET. Cancellation happens after payment and a no-show
+# after check-in, so those tickets still count as issued and paid (and
+# checked in) in the funnel; every other state is its own stage.
+STATE_OFFSET = -min(TicketState)
+STAGE_REACHED = np.arange(min(TicketState), max(TicketState) + 1)
+STAGE_REACHED[TicketState.CANCELLED + STATE_OFFSET] = TicketState.PAID
+STAGE_REACHED[TicketState.NO_SHOW + STATE_OFFSET] = TicketState.CHECKED_IN
+
+# Stage histogram bins: CREATED .. CLOSED
+STAGE_BINS = max(TicketState) + 1
+
+# Columnar results: "flight" lists the flight ids; "state" (int8 TicketState),
+# "price" (float64) and "no_show" (bool) are (flight, ticket) matrices whose
+# row r belongs to flight_ids[r]
 flights_data = {}
 
+# KPI columns, in report order
+KPI_FIELDS = ["Tickets issued", "Tickets paid", "Checked-in", "Boarded", "Closed",
+              "Revenue", "Load factor", "Completion rate", "No-show rate"]
+
 # -----------------------
 # Simulate Ticket Lifecycle
 # -----------------------
-def simulate_ticket_lifecycle(flight_id):
-    tickets = []
-    for i in range(TICKETS_PER_FLIGHT):
-        ticket = Ticket(flight_id=flight_id, passenger_id=i+1)
-        price = random.uniform(*TICKET_PRICE_RANGE)
+def validate_flight(flight_id, state, prices, no_show):
+    """
+    Replays one flight's drawn outcomes through the domain Ticket and checks
+    that every ticket ends in the state the simulator recorded.
+    """
+    for i, (code, price) in enumerate(zip(state.tolist(), prices.tolist()), start=1):
+        ticket = Ticket(ticket_id=f"{flight_id}_T{i}", flight_id=flight_id)
         ticket.issue(price=price)
+        ticket.pay(amount=price)
 
-        # Pay ticket
-        ticket.pay()
-
-        # Randomly cancel
-        if random.random() < CANCEL_PROB:
+        if code == TicketState.CANCELLED:
             ticket.cancel()
         else:
-            # Check-in
             ticket.check_in()
-
-            # Randomly no-show
-            if random.random() < NO_SHOW_PROB:
+            if code == TicketState.NO_SHOW:
                 ticket.no_show()
             else:
-                # Board and close
                 ticket.board()
                 ticket.close()
 
-        tickets.append(ticket)
-    flights_data[flight_id] = tickets
+        if ticket.state != code or ticket.no_show_flag != bool(no_show[i - 1]):
+            raise ValueError(
+                f"{ticket.ticket_id}: simulated state {code} but Ticket ended in "
+                f"{ticket.state!r} (no_show_flag={ticket.no_show_flag})"
+            )
+
+
+def simulate_ticket_lifecycle(flight_ids, validate=False):
+    """
+    Draws every flight at once as (flight, ticket) matrices: each ticket is
+    issued and paid, then cancelled (CANCEL_PROB), a no-show after check-in
+    (NO_SHOW_PROB) or boarded and closed. Only the resulting states are kept.
+
+    No Ticket objects are built unless validate=True, which replays every
+    ticket through the domain model as a cross-check.
+    """
+    shape = (len(flight_ids), TICKETS_PER_FLIGHT)
+    prices = rng.uniform(*TICKET_PRICE_RANGE, size=shape)
+
+    # One draw for both outcome checks per ticket: [..., 0] cancel, [..., 1] no-show
+    # (float32 is plenty to compare against a probability)
+    draws = rng.random((*shape, 2), dtype=np.float32)
+    cancelled = draws[..., 0] < CANCEL_PROB
+    no_show = ~cancelled & (draws[..., 1] < NO_SHOW_PROB)
+
+    state = np.full(shape, TicketState.CLOSED, dtype=np.int8)
+    state[cancelled] = TicketState.CANCELLED
+    state[no_show] = TicketState.NO_SHOW
+
+    if validate:
+        for row, flight_id in enumerate(flight_ids):
+            validate_flight(flight_id, state[row], prices[row], no_show[row])
+
+    flights_data.update(flight=list(flight_ids), state=state, price=prices, no_show=no_show)
 
 
 # -----------------------
 # Compute Statistics
 # -----------------------
 def compute_kpis():
-    report = {}
-    for flight_id, tickets in flights_data.items():
-        total = len(tickets)
-        issued = sum(1 for t in tickets if t.state >= "issued")
-        paid = sum(1 for t in tickets if t.state >= "paid")
-        checked_in = sum(1 for t in tickets if t.state >= "checked_in")
-        boarded = sum(1 for t in tickets if t.state >= "boarded")
-        closed = sum(1 for t in tickets if t.state == "closed")
-        no_show = sum(1 for t in tickets if getattr(t, "no_show_flag", False))
-        revenue = sum(t.price for t in tickets if t.state >= "paid")
-
-        load_factor = (boarded / SEATS_PER_FLIGHT) * 100
-        completion_rate = (closed / total) * 100
-        no_show_rate = (no_show / total) * 100
-
-        report[flight_id] = {
-            "Tickets issued": issued,
-            "Tickets paid": paid,
-            "Checked-in": checked_in,
-            "Boarded": boarded,
-            "Closed": closed,
-            "Revenue": revenue,
-            "Load factor": load_factor,
-            "Completion rate": completion_rate,
-            "No-show rate": no_show_rate,
-        }
-    return report
+    """
+    Returns {"Flight": [flight ids], <KPI>: per-flight array, ...}.
+    All flights are reduced together, straight from the (flight, ticket)
+    matrices.
+    """
+    state = flights_data["state"]
+    n_flights, total = state.shape
+
+    stage = STAGE_REACHED[state.astype(np.intp) + STATE_OFFSET]
+
+    # One pass: per-flight histogram of stages reached (row r uses bins
+    # r*STAGE_BINS ... r*STAGE_BINS + STAGE_BINS - 1)
+    bins = stage + np.arange(n_flights)[:, None] * STAGE_BINS
+    hist = np.bincount(bins.ravel(), minlength=n_flights * STAGE_BINS).reshape(n_flights, STAGE_BINS)
+
+    # Stages follow the lifecycle, so "reached at least X" is the
+    # histogram summed from X upwards
+    at_least = hist[:, ::-1].cumsum(axis=1)[:, ::-1]
+
+    boarded = at_least[:, TicketState.BOARDED]
+    closed = hist[:, TicketState.CLOSED]
+    no_show = np.count_nonzero(flights_data["no_show"], axis=1)
+
+    return {
+        "Flight": flights_data["flight"],
+        "Tickets issued": at_least[:, TicketState.ISSUED],
+        "Tickets paid": at_least[:, TicketState.PAID],
+        "Checked-in": at_least[:, TicketState.CHECKED_IN],
+        "Boarded": boarded,
+        "Closed": closed,
+        # Revenue only from tickets whose state is PAID or later (negative
+        # CANCELLED/NO_SHOW codes drop out), unlike the funnel counts above
+        "Revenue": np.where(state >= TicketState.PAID, flights_data["price"], 0.0).sum(axis=1),
+        "Load factor": (boarded / SEATS_PER_FLIGHT) * 100,
+        "Completion rate": (closed / total) * 100,
+        "No-show rate": (no_show / total) * 100,
+    }
+
+
+def report_rows(report):
+    """
+    One (flight, *KPI_FIELDS) tuple of Python scalars per flight.
+    """
+    return list(zip(report["Flight"], *(report[k].tolist() for k in KPI_FIELDS)))
 
 
 # -----------------------
 # Generate Graphs
 # -----------------------
 def plot_kpis(report):
-    flights = list(report.keys())
-    load_factors = [report[f]["Load factor"] for f in flights]
-    revenues = [report[f]["Revenue"] for f in flights]
-
-    plt.figure(figsize=(10,5))
-    plt.bar(flights, load_factors, color='green')
-    plt.ylabel("Load Factor (%)")
-    plt.title("Flight Load Factor")
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig("load_factor_per_flight.png")
-    plt.close()
-
-    plt.figure(figsize=(10,5))
-    plt.bar(flights, revenues, color='blue')
-    plt.ylabel("Revenue ($)")
-    plt.title("Flight Revenue")
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig("revenue_per_flight.png")
-    plt.close()
+    flights = report["Flight"]
+    load_factors = report["Load factor"]
+    revenues = report["Revenue"]
+
+    # Both charts on one figure: one layout pass and one PNG encode
+    fig, (ax_load, ax_revenue) = plt.subplots(1, 2, figsize=(16,5))
+
+    ax_load.bar(flights, load_factors, color='green')
+    ax_load.set_ylabel("Load Factor (%)")
+    ax_load.set_title("Flight Load Factor")
+    ax_load.tick_params(axis="x", labelrotation=45)
+
+    ax_revenue.bar(flights, revenues, color='blue')
+    ax_revenue.set_ylabel("Revenue ($)")
+    ax_revenue.set_title("Flight Revenue")
+    ax_revenue.tick_params(axis="x", labelrotation=45)
+
+    fig.tight_layout()
+    fig.savefig("kpis_per_flight.png")
+    plt.close(fig)
 
 
 # -----------------------
 # Save CSV Report
 # -----------------------
 def save_csv_report(report):
-    with open("kpi_report.csv", "w", newline="") as csvfile:
-        fieldnames = ["Flight", "Tickets issued", "Tickets paid", "Checked-in",
-                      "Boarded", "Closed", "Revenue", "Load factor", 
-                      "Completion rate", "No-show rate"]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        for flight, data in report.items():
-            row = {"Flight": flight}
-            row.update(data)
-            writer.writerow(row)
+    rows = report_rows(report)
+    with open("kpi_report.csv", "w", newline="", buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Flight", *KPI_FIELDS])
+        writer.writerows(rows)
 
 
 # -----------------------
 # Run Simulation
 # -----------------------
 def run_simulation():
-    for flight_id in [f"FL-{1000+i}" for i in range(1, NUM_FLIGHTS+1)]:
-        simulate_ticket_lifecycle(flight_id)
+    simulate_ticket_lifecycle([f"FL-{1000+i}" for i in range(1, NUM_FLIGHTS+1)])
 
     report = compute_kpis()
     save_csv_report(report)
     plot_kpis(report)
 
-    print("✅ Ticket lifecycle simulation completed.")
-    for flight, data in report.items():
-        print(f"\nFlight {flight}")
-        for key, value in data.items():
+    # Format the whole summary first, then write it once
+    buf = io.StringIO()
+    buf.write("✅ Ticket lifecycle simulation completed.\n")
+    for flight, *values in report_rows(report):
+        buf.write(f"\nFlight {flight}\n")
+        for key, value in zip(KPI_FIELDS, values):
             if isinstance(value, float):
-                print(f"  {key:<15}: {value:.2f}")
+                buf.write(f"  {key:<15}: {value:.2f}\n")
             else:
-                print(f"  {key:<15}: {value}")
+                buf.write(f"  {key:<15}: {value}\n")
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == "__main__":